@@ -5,15 +5,33 @@ import argparse
 import json
 import logging
 import sys
+from contextlib import nullcontext
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Any, Dict, List
 
 ROOT = Path(__file__).resolve().parent
 if str(ROOT / "src") not in sys.path:
     sys.path.insert(0, str(ROOT / "src"))
 
 from compliance_agent.agent import ComplianceNewsAgent
-from compliance_agent.report import build_markdown_report, build_structured_payload
+from compliance_agent.cli import add_collection_arguments, check_collection_arguments, gather_items
+from compliance_agent.models import NewsItem, TopicsConfig
+from compliance_agent.prerender import PAGE_SIZE, write_prerendered_site
+from compliance_agent.profiling import PipelineProfiler, profile_stage
+from compliance_agent.report import (
+    build_markdown_report,
+    build_payload_delta,
+    build_structured_payload,
+)
+from compliance_agent.site_output import (
+    content_digest,
+    load_previous_payload,
+    payload_fingerprint,
+    publish_artifact,
+    publish_delta,
+    version_of,
+)
 
 
 def parse_args() -> argparse.Namespace:
@@ -23,22 +41,36 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument(
         "--output-json",
         type=Path,
-        default=Path("artifacts/data/latest.json"),
-        help=(
-            "Path where the structured JSON payload will be written."
-            " Defaults to a local artifacts directory so generated files don't"
-            " disturb tracked site assets."
-        ),
         default=Path("docs/data/latest.json"),
         help="Path where the structured JSON payload will be written.",
     )
     parser.add_argument(
         "--output-markdown",
         type=Path,
-        default=Path("artifacts/latest.md"),
         default=Path("reports/latest.md"),
         help="Optional path for a Markdown snapshot (set to '-' to skip).",
     )
+    parser.add_argument(
+        "--output-html",
+        type=Path,
+        default=Path("docs/index.html"),
+        help=(
+            "Path for the prerendered dashboard page; per-vertical pages go to a 'verticals'"
+            " directory next to it (set to '-' to skip)."
+        ),
+    )
+    parser.add_argument(
+        "--html-template",
+        type=Path,
+        default=Path("docs/index.html"),
+        help="Dashboard template with prerender regions (may be the same file as --output-html).",
+    )
+    parser.add_argument(
+        "--page-size",
+        type=int,
+        default=PAGE_SIZE,
+        help="Number of articles prerendered on the dashboard's first page.",
+    )
     parser.add_argument(
         "--limit",
         type=int,
@@ -62,12 +94,125 @@ def parse_args() -> argparse.Namespace:
         default=Path("sample_data"),
         help="Directory containing offline sample articles.",
     )
+    parser.add_argument(
+        "--no-compress",
+        action="store_true",
+        help="Skip writing precompressed .gz/.br siblings next to each artifact.",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Rewrite artifacts even when their content is unchanged since the last run.",
+    )
+    add_collection_arguments(parser)
+    parser.add_argument(
+        "--profile",
+        type=Path,
+        metavar="DIR",
+        default=None,
+        help="Write per-stage cProfile stats, memory peaks, and flamegraph stacks to DIR.",
+    )
     parser.add_argument(
         "--log-level",
         default="INFO",
         help="Logging verbosity (DEBUG, INFO, WARNING, ERROR).",
     )
-    return parser.parse_args()
+    args = parser.parse_args()
+    check_collection_arguments(parser, args)
+    return args
+
+
+def write_artifacts(
+    args: argparse.Namespace,
+    items: List[NewsItem],
+    topics: TopicsConfig,
+    profiler: PipelineProfiler | None = None,
+    generated_at: datetime | None = None,
+) -> None:
+    # Snapshot renders pass the collection time so the pages never claim fresher data.
+    generated_at = generated_at or datetime.now(timezone.utc)
+    with profile_stage(profiler, "render"):
+        payload = build_structured_payload(items, topics, generated_at)
+
+    with profile_stage(profiler, "serialize"):
+        previous_payload = load_previous_payload(args.output_json)
+        published = publish_artifact(
+            args.output_json,
+            (json.dumps(payload, indent=2) + "\n").encode("utf-8"),
+            fingerprint=payload_fingerprint(payload),
+            precompress=not args.no_compress,
+            force=args.force,
+        )
+    if published.changed:
+        logging.info("Structured payload written to %s (%s)", published.path, published.hashed_path.name)
+        if previous_payload is not None:
+            write_delta(args, previous_payload, payload, published.version, profiler)
+
+    if args.output_html != Path("-"):
+        # Render what latest.json actually holds: an unchanged payload keeps its old timestamp.
+        published_payload = payload if published.changed or previous_payload is None else previous_payload
+        write_pages(args, published_payload, profiler)
+
+    if args.output_markdown != Path("-"):
+        with profile_stage(profiler, "render"):
+            markdown = build_markdown_report(items, topics, generated_at)
+        with profile_stage(profiler, "serialize"):
+            # The heading carries the run date; only the body decides whether the report changed.
+            published = publish_artifact(
+                args.output_markdown,
+                markdown.encode("utf-8"),
+                fingerprint=content_digest(markdown.partition("\n")[2].encode("utf-8")),
+                precompress=not args.no_compress,
+                force=args.force,
+            )
+        if published.changed:
+            logging.info("Markdown report written to %s (%s)", published.path, published.hashed_path.name)
+
+
+def write_pages(
+    args: argparse.Namespace,
+    payload: Dict[str, Any],
+    profiler: PipelineProfiler | None = None,
+) -> None:
+    with profile_stage(profiler, "render"):
+        try:
+            changed = write_prerendered_site(args.output_html, args.html_template, payload, args.page_size)
+        except (ValueError, FileNotFoundError) as exc:
+            raise SystemExit(f"error: {exc}") from exc
+    if changed:
+        logging.info("Prerendered %s page(s) next to %s", len(changed), args.output_html)
+    else:
+        logging.info("Prerendered pages unchanged since last run")
+
+
+def write_delta(
+    args: argparse.Namespace,
+    previous_payload: Dict[str, Any],
+    payload: Dict[str, Any],
+    version: str,
+    profiler: PipelineProfiler | None = None,
+) -> None:
+    previous_version = version_of(payload_fingerprint(previous_payload))
+    if previous_version == version:
+        return
+    with profile_stage(profiler, "render"):
+        delta = build_payload_delta(previous_payload, payload, previous_version, version)
+    with profile_stage(profiler, "serialize"):
+        delta_path = publish_delta(
+            args.output_json,
+            (json.dumps(delta, separators=(",", ":")) + "\n").encode("utf-8"),
+            previous_version,
+            version,
+            precompress=not args.no_compress,
+        )
+    counts = delta["counts"]
+    logging.info(
+        "Delta %s written (%s added, %s changed, %s removed)",
+        delta_path.name,
+        counts["added"],
+        counts["changed"],
+        counts["removed"],
+    )
 
 
 def main() -> None:
@@ -77,23 +222,18 @@ def main() -> None:
         format="%(asctime)s | %(levelname)s | %(name)s | %(message)s",
     )
 
-    agent = ComplianceNewsAgent(config_dir=args.config_dir, sample_data_dir=args.sample_data_dir)
-    items = agent.collect_news(offline=args.offline, limit=args.limit)
-
-    generated_at = datetime.now(timezone.utc)
-    payload = build_structured_payload(items, agent.config.topics, generated_at)
-
-    output_json = args.output_json
-    output_json.parent.mkdir(parents=True, exist_ok=True)
-    output_json.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
-    logging.info("Structured payload written to %s", output_json)
-
-    if args.output_markdown != Path("-"):
-        markdown = build_markdown_report(items, agent.config.topics, generated_at)
-        output_md = args.output_markdown
-        output_md.parent.mkdir(parents=True, exist_ok=True)
-        output_md.write_text(markdown, encoding="utf-8")
-        logging.info("Markdown report written to %s", output_md)
+    profiler = PipelineProfiler(args.profile) if args.profile else None
+    with profiler or nullcontext():
+        agent = ComplianceNewsAgent(
+            config_dir=args.config_dir,
+            sample_data_dir=args.sample_data_dir,
+            profiler=profiler,
+        )
+        items, collected_at = gather_items(args, agent)
+        if args.shard is not None:
+            logging.info("Shard %s collected; render after merging with merge_snapshots.py", args.shard)
+            return
+        write_artifacts(args, items, agent.config.topics, profiler, generated_at=collected_at)
 
 
 if __name__ == "__main__":
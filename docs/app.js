@@ -1,5 +1,7 @@
-const DATA_URL = 'data/latest.json';
-const SAMPLE_DATA_URL = 'data/sample.json';
+import { loadBriefingIndex } from './briefing-data.js';
+
+const OVERSCAN_ROWS = 6;
+const SEARCH_DEBOUNCE_MS = 150;
 
 const elements = {
   refreshButton: document.querySelector('#refreshButton'),
@@ -8,52 +10,220 @@ const elements = {
   sourceCount: document.querySelector('#sourceCount'),
   sourcesList: document.querySelector('#sourcesList'),
   articlesContainer: document.querySelector('#articlesContainer'),
+  verticalFilter: document.querySelector('#verticalFilter'),
+  complianceFilter: document.querySelector('#complianceFilter'),
+  searchInput: document.querySelector('#searchInput'),
+  resultCount: document.querySelector('#resultCount'),
 };
 
 const state = {
-  data: null,
+  articles: [],
+  matches: new Uint32Array(0),
   isLoading: false,
   usedFallback: false,
+  querySequence: 0,
 };
 
-async function fetchJson(url) {
-  const response = await fetch(url, { cache: 'no-cache' });
-  if (!response.ok) {
-    const error = new Error(`Failed to load data (${response.status})`);
-    error.status = response.status;
-    error.url = url;
-    throw error;
+// ---------------------------------------------------------------------------
+// Data engines: a module worker when available, the same code in-page otherwise
+// (for example when the page is opened from the file system).
+// ---------------------------------------------------------------------------
+function createWorkerEngine() {
+  const worker = new Worker(new URL('./worker.js', import.meta.url), { type: 'module' });
+  const pending = new Map();
+  let nextRequestId = 0;
+
+  const rejectAll = (error) => {
+    pending.forEach(({ reject }) => reject(error));
+    pending.clear();
+  };
 
-const state = {
-  data: null,
-};
+  worker.addEventListener('message', (event) => {
+    const { requestId, type } = event.data ?? {};
+    const entry = pending.get(requestId);
+    if (!entry) {
+      return;
+    }
+    pending.delete(requestId);
+    if (type === 'error') {
+      entry.reject(new Error(event.data.message));
+    } else {
+      entry.resolve(event.data);
+    }
+  });
 
-async function loadData() {
-  const response = await fetch(DATA_URL, { cache: 'no-cache' });
-  if (!response.ok) {
-    throw new Error(`Failed to load data (${response.status})`);
-  }
-  return response.json();
+  worker.addEventListener('error', (event) => {
+    event.preventDefault();
+    const error = new Error(event.message || 'Dashboard worker failed to start.');
+    error.workerFailure = true;
+    rejectAll(error);
+  });
+
+  const request = (message) =>
+    new Promise((resolve, reject) => {
+      const requestId = nextRequestId;
+      nextRequestId += 1;
+      pending.set(requestId, { resolve, reject });
+      worker.postMessage({ ...message, requestId });
+    });
+
+  return {
+    usesWorker: true,
+    async load() {
+      const { meta, articles, facets } = await request({ type: 'load', baseUrl: document.baseURI });
+      return { meta, articles, facets };
+    },
+    async query(filters) {
+      const { matches } = await request({ type: 'query', filters });
+      return matches;
+    },
+    dispose() {
+      worker.terminate();
+      rejectAll(new Error('Dashboard worker stopped.'));
+    },
+  };
 }
 
-async function loadBriefingData() {
-async function loadData() {
-  try {
-    const payload = await fetchJson(DATA_URL);
-    return { payload, usedFallback: false };
-  } catch (primaryError) {
-    console.warn('Primary data request failed. Attempting to use sample payload.', primaryError);
+function createLocalEngine() {
+  let briefingIndex = null;
+  return {
+    usesWorker: false,
+    async load() {
+      const { index, meta } = await loadBriefingIndex(document.baseURI);
+      briefingIndex = index;
+      return { meta, articles: index.articles, facets: index.facets };
+    },
+    async query(filters) {
+      return briefingIndex ? briefingIndex.query(filters) : new Uint32Array(0);
+    },
+    dispose() {},
+  };
+}
+
+let engine = null;
+
+async function loadWithEngine() {
+  if (!engine) {
     try {
-      const fallbackPayload = await fetchJson(SAMPLE_DATA_URL);
-      return { payload: fallbackPayload, usedFallback: true };
-    } catch (fallbackError) {
-      const error = new Error('Unable to load compliance briefing data.');
-      error.cause = { primaryError, fallbackError };
+      engine = createWorkerEngine();
+    } catch (error) {
+      console.warn('Web Workers unavailable; filtering on the main thread.', error);
+      engine = createLocalEngine();
+    }
+  }
+
+  try {
+    return await engine.load();
+  } catch (error) {
+    if (!engine.usesWorker || !error.workerFailure) {
       throw error;
     }
+    console.warn('Dashboard worker failed; filtering on the main thread.', error);
+    engine.dispose();
+    engine = createLocalEngine();
+    return engine.load();
+  }
+}
+
+// ---------------------------------------------------------------------------
+// Virtualized list: only the rows inside the scroll viewport exist in the DOM.
+// ---------------------------------------------------------------------------
+class VirtualList {
+  constructor(container, renderRow) {
+    this.container = container;
+    this.renderRow = renderRow;
+    this.rows = new Map();
+    this.count = 0;
+    this.rowHeight = 0;
+    this.frame = 0;
+    this.spacer = document.createElement('div');
+    this.spacer.className = 'virtual-spacer';
+
+    container.addEventListener('scroll', () => this.schedule(), { passive: true });
+    window.addEventListener('resize', () => {
+      this.measure();
+      this.schedule();
+    });
+  }
+
+  measure() {
+    const height = parseFloat(getComputedStyle(this.container).getPropertyValue('--row-height'));
+    const rowHeight = Number.isFinite(height) && height > 0 ? height : 240;
+    if (rowHeight !== this.rowHeight) {
+      this.rowHeight = rowHeight;
+      this.clearRows();
+      this.spacer.style.height = `${this.count * this.rowHeight}px`;
+    }
+  }
+
+  setCount(count) {
+    this.count = count;
+    this.clearRows();
+    this.container.classList.add('is-virtual');
+    if (!this.spacer.isConnected) {
+      this.container.replaceChildren(this.spacer);
+    }
+    this.container.scrollTop = 0;
+    this.measure();
+    this.spacer.style.height = `${this.count * this.rowHeight}px`;
+    this.render();
+  }
+
+  detach() {
+    this.count = 0;
+    this.clearRows();
+    this.container.classList.remove('is-virtual');
+    this.spacer.remove();
+  }
+
+  clearRows() {
+    this.rows.forEach((row) => row.remove());
+    this.rows.clear();
+  }
+
+  schedule() {
+    if (this.frame || !this.count) {
+      return;
+    }
+    this.frame = requestAnimationFrame(() => {
+      this.frame = 0;
+      this.render();
+    });
+  }
+
+  render() {
+    const { scrollTop, clientHeight } = this.container;
+    const viewport = clientHeight || window.innerHeight;
+    const first = Math.max(0, Math.floor(scrollTop / this.rowHeight) - OVERSCAN_ROWS);
+    const last = Math.min(this.count, Math.ceil((scrollTop + viewport) / this.rowHeight) + OVERSCAN_ROWS);
+
+    this.rows.forEach((row, index) => {
+      if (index < first || index >= last) {
+        row.remove();
+        this.rows.delete(index);
+      }
+    });
+
+    const fragment = document.createDocumentFragment();
+    for (let index = first; index < last; index += 1) {
+      if (this.rows.has(index)) {
+        continue;
+      }
+      const row = this.renderRow(index);
+      row.style.transform = `translateY(${index * this.rowHeight}px)`;
+      row.style.height = `${this.rowHeight}px`;
+      row.setAttribute('aria-posinset', String(index + 1));
+      row.setAttribute('aria-setsize', String(this.count));
+      this.rows.set(index, row);
+      fragment.appendChild(row);
+    }
+    this.spacer.appendChild(fragment);
   }
 }
 
+// ---------------------------------------------------------------------------
+// Rendering
+// ---------------------------------------------------------------------------
 function formatDate(isoString, { includeTime = true, timeZone } = {}) {
   if (!isoString) {
     return 'Date unavailable';
@@ -83,49 +253,21 @@ function formatDate(isoString, { includeTime = true, timeZone } = {}) {
   return parsed.toLocaleString(undefined, options);
 }
 
-function flattenArticles(data) {
-  if (!data?.sections?.length) {
-    return [];
-  }
-
-  const articles = [];
-
-  data.sections.forEach((section) => {
-    const verticalFallback = section?.vertical ? [section.vertical] : [];
-    section.segments?.forEach((segment) => {
-      const complianceFallback = segment?.compliance ? [segment.compliance] : [];
-      segment.items?.forEach((item) => {
-        articles.push({
-          ...item,
-          verticals: item.verticals?.length ? item.verticals : verticalFallback,
-          compliance: item.compliance?.length ? item.compliance : complianceFallback,
-        });
-      });
-    });
-  });
-
-  return articles.sort((a, b) => {
-    const first = new Date(b.published ?? 0).getTime();
-    const second = new Date(a.published ?? 0).getTime();
-    return Number.isNaN(first - second) ? 0 : first - second;
-  });
-}
-
-function updateSummary(data, { usedFallback = false } = {}) {
-  const summary = data?.summary ?? {};
+function updateSummary(meta, { usedFallback = false } = {}) {
+  const summary = meta?.summary ?? {};
   const sources = Array.isArray(summary.sources) ? summary.sources : [];
 
   if (usedFallback) {
-    if (data?.generated_at) {
-      elements.generatedAt.textContent = `Sample briefing from ${formatDate(data.generated_at, {
+    if (meta?.generated_at) {
+      elements.generatedAt.textContent = `Sample briefing from ${formatDate(meta.generated_at, {
         timeZone: 'UTC',
       })} – live feed unavailable.`;
     } else {
       elements.generatedAt.textContent = 'Sample briefing loaded – live feed unavailable.';
     }
   } else {
-    elements.generatedAt.textContent = data?.generated_at
-      ? `Last refreshed ${formatDate(data.generated_at, { timeZone: 'UTC' })}`
+    elements.generatedAt.textContent = meta?.generated_at
+      ? `Last refreshed ${formatDate(meta.generated_at, { timeZone: 'UTC' })}`
       : 'Last refreshed: unavailable';
   }
 
@@ -145,77 +287,156 @@ function updateSummary(data, { usedFallback = false } = {}) {
   }
 }
 
-function renderArticles(articles) {
-  const container = elements.articlesContainer;
-  container.innerHTML = '';
+function createArticleElement(item) {
+  const article = document.createElement('article');
+  article.className = 'briefing-item';
+
+  const title = document.createElement('h3');
+  const link = document.createElement('a');
+  link.href = item.link || '#';
+  link.target = '_blank';
+  link.rel = 'noopener noreferrer';
+  link.textContent = item.title || 'Untitled update';
+  title.appendChild(link);
+  article.appendChild(title);
+
+  if (item.verticals?.length) {
+    const verticalsRow = document.createElement('div');
+    verticalsRow.className = 'briefing-verticals';
+
+    item.verticals.forEach((vertical) => {
+      if (!vertical?.label) {
+        return;
+      }
+      const pill = document.createElement('span');
+      pill.className = 'vertical-pill';
+      pill.dataset.vertical = vertical.key || 'default';
+      pill.textContent = vertical.label;
+      verticalsRow.appendChild(pill);
+    });
 
-  if (!articles.length) {
-    container.innerHTML = '<p class="empty-state">No updates were published in the latest run.</p>';
-    return;
+    if (verticalsRow.childElementCount) {
+      article.appendChild(verticalsRow);
+    }
   }
 
-  articles.forEach((item) => {
-    const article = document.createElement('article');
-    article.className = 'briefing-item';
-
-    const title = document.createElement('h3');
-    const link = document.createElement('a');
-    link.href = item.link || '#';
-    link.target = '_blank';
-    link.rel = 'noopener noreferrer';
-    link.textContent = item.title || 'Untitled update';
-    title.appendChild(link);
-    article.appendChild(title);
-
-    if (item.verticals?.length) {
-      const verticalsRow = document.createElement('div');
-      verticalsRow.className = 'briefing-verticals';
-
-      item.verticals.forEach((vertical) => {
-        if (!vertical?.label) {
-          return;
-        }
-        const pill = document.createElement('span');
-        pill.className = 'vertical-pill';
-        pill.dataset.vertical = vertical.key || 'default';
-        pill.textContent = vertical.label;
-        verticalsRow.appendChild(pill);
-      });
-
-      if (verticalsRow.childElementCount) {
-        article.appendChild(verticalsRow);
-      }
-    }
+  const meta = document.createElement('p');
+  meta.className = 'briefing-meta';
+  const source = item.source || 'Source unavailable';
+  meta.textContent = `${source} · ${formatDate(item.published, { includeTime: false })}`;
+  article.appendChild(meta);
+
+  if (item.summary) {
+    const summary = document.createElement('p');
+    summary.className = 'briefing-summary';
+    summary.textContent = item.summary;
+    article.appendChild(summary);
+  }
 
-    const meta = document.createElement('p');
-    meta.className = 'briefing-meta';
-    const source = item.source || 'Source unavailable';
-    meta.textContent = `${source} · ${formatDate(item.published, { includeTime: false })}`;
-    article.appendChild(meta);
-
-    if (item.summary) {
-      const summary = document.createElement('p');
-      summary.className = 'briefing-summary';
-      summary.textContent = item.summary;
-      article.appendChild(summary);
+  if (item.compliance?.length) {
+    const compliance = document.createElement('p');
+    compliance.className = 'briefing-compliance';
+    const labels = item.compliance
+      .filter((entry) => Boolean(entry?.label))
+      .map((entry) => entry.label);
+    if (labels.length) {
+      compliance.textContent = `Compliance focus: ${labels.join(' · ')}`;
+      article.appendChild(compliance);
     }
+  }
 
-    if (item.compliance?.length) {
-      const compliance = document.createElement('p');
-      compliance.className = 'briefing-compliance';
-      const labels = item.compliance
-        .filter((entry) => Boolean(entry?.label))
-        .map((entry) => entry.label);
-      if (labels.length) {
-        compliance.textContent = `Compliance focus: ${labels.join(' · ')}`;
-        article.appendChild(compliance);
-      }
-    }
+  return article;
+}
+
+const articleList = new VirtualList(elements.articlesContainer, (position) =>
+  createArticleElement(state.articles[state.matches[position]]),
+);
+
+function showMessage(className, text) {
+  articleList.detach();
+  const message = document.createElement('p');
+  message.className = className;
+  message.textContent = text;
+  elements.articlesContainer.replaceChildren(message);
+}
+
+function renderMatches() {
+  const total = state.articles.length;
+  const shown = state.matches.length;
+  if (elements.resultCount) {
+    elements.resultCount.textContent = shown === total
+      ? `Showing all ${total} updates`
+      : `Showing ${shown} of ${total} updates`;
+  }
+
+  if (!total) {
+    showMessage('empty-state', 'No updates were published in the latest run.');
+    return;
+  }
+  if (!shown) {
+    showMessage('empty-state', 'No updates match the selected filters.');
+    return;
+  }
+  articleList.setCount(shown);
+}
 
-    container.appendChild(article);
+// ---------------------------------------------------------------------------
+// Filters
+// ---------------------------------------------------------------------------
+function populateSelect(select, options) {
+  if (!select) {
+    return;
+  }
+  const previous = select.value;
+  const defaultOption = select.querySelector('option[value="all"]');
+  select.replaceChildren(defaultOption);
+  options.forEach(({ key, label }) => {
+    const option = document.createElement('option');
+    option.value = key;
+    option.textContent = label;
+    select.appendChild(option);
   });
+  select.value = options.some((option) => option.key === previous) ? previous : 'all';
+}
+
+function currentFilters() {
+  return {
+    vertical: elements.verticalFilter?.value ?? 'all',
+    compliance: elements.complianceFilter?.value ?? 'all',
+    search: elements.searchInput?.value.trim() ?? '',
+  };
 }
 
+async function applyFilters() {
+  if (!engine || !state.articles.length) {
+    return;
+  }
+  state.querySequence += 1;
+  const sequence = state.querySequence;
+  try {
+    const matches = await engine.query(currentFilters());
+    if (sequence !== state.querySequence) {
+      return;
+    }
+    state.matches = matches;
+    renderMatches();
+  } catch (error) {
+    console.error(error);
+  }
+}
+
+let searchTimer = 0;
+
+elements.verticalFilter?.addEventListener('change', applyFilters);
+elements.complianceFilter?.addEventListener('change', applyFilters);
+elements.searchInput?.addEventListener('input', () => {
+  clearTimeout(searchTimer);
+  searchTimer = setTimeout(applyFilters, SEARCH_DEBOUNCE_MS);
+});
+
+// ---------------------------------------------------------------------------
+// Refresh cycle
+// ---------------------------------------------------------------------------
 function setLoading(isLoading) {
   state.isLoading = isLoading;
   const button = elements.refreshButton;
@@ -232,36 +453,72 @@ function setLoading(isLoading) {
   }
 }
 
+// True while the server-rendered briefing is on screen and no live data has
+// replaced it yet.
+function showsPrerenderedBriefing() {
+  return !state.articles.length && Boolean(elements.articlesContainer.querySelector('.briefing-item'));
+}
+
+function keepPrerenderedBriefing() {
+  if (elements.resultCount) {
+    elements.resultCount.textContent = 'Filters are unavailable right now – showing the published briefing.';
+  }
+}
+
+// The server-rendered briefing stays in place until live data can replace it,
+// so the first paint never waits for the payload. The bundled sample payload
+// never replaces it either: real, if slightly older, articles beat a preview.
 async function refreshData() {
   if (state.isLoading) {
     return;
   }
 
+  const keepContent = showsPrerenderedBriefing();
   setLoading(true);
-  elements.articlesContainer.innerHTML = '<p class="loading">Loading the latest briefing…</p>';
+  if (!keepContent) {
+    showMessage('loading', 'Loading the latest briefing…');
+  }
 
   try {
-    const { payload, usedFallback } = await loadBriefingData();
-    const { payload, usedFallback } = await loadData();
-    state.data = payload;
+    const { meta, articles, facets } = await loadWithEngine();
+    const { usedFallback } = meta;
+    if (keepContent && usedFallback) {
+      keepPrerenderedBriefing();
+      return;
+    }
+    state.articles = articles;
+    state.matches = new Uint32Array(0);
     state.usedFallback = usedFallback;
     if (usedFallback) {
       document.body.classList.add('using-fallback-data');
     } else {
       document.body.classList.remove('using-fallback-data');
     }
-    updateSummary(payload, { usedFallback });
-    renderArticles(flattenArticles(payload));
+    updateSummary(meta, { usedFallback });
+    populateSelect(elements.verticalFilter, facets.verticals);
+    populateSelect(elements.complianceFilter, facets.compliance);
+    if (articles.length) {
+      await applyFilters();
+    } else {
+      renderMatches();
+    }
   } catch (error) {
     console.error(error);
+    if (keepContent) {
+      keepPrerenderedBriefing();
+      return;
+    }
     document.body.classList.remove('using-fallback-data');
     state.usedFallback = false;
+    state.articles = [];
     elements.generatedAt.textContent = 'Unable to refresh – please try again later.';
     elements.totalItems.textContent = '0';
     elements.sourceCount.textContent = '0';
     elements.sourcesList.textContent = 'Sources unavailable – please retry.';
-    elements.articlesContainer.innerHTML =
-      '<p class="empty-state">Unable to load the latest report. Check your network connection and try again.</p>';
+    showMessage(
+      'empty-state',
+      'Unable to load the latest report. Check your network connection and try again.',
+    );
   } finally {
     setLoading(false);
   }
@@ -272,201 +529,3 @@ if (elements.refreshButton) {
 }
 
 refreshData();
-function formatDate(isoString) {
-  if (!isoString) {
-    return 'Published date unavailable';
-  }
-  const date = new Date(isoString);
-  if (Number.isNaN(date.getTime())) {
-    return isoString;
-  }
-  return date.toLocaleString(undefined, {
-    year: 'numeric',
-    month: 'short',
-    day: 'numeric',
-    hour: '2-digit',
-    minute: '2-digit',
-    timeZone: 'UTC',
-  });
-}
-
-function renderSnapshot(summary, generatedAt) {
-  const generatedAtEl = document.querySelector('#generatedAt');
-  const totalItemsEl = document.querySelector('#totalItems');
-  const sourcesEl = document.querySelector('#sourcesList');
-  const verticalBreakdownEl = document.querySelector('#verticalBreakdown');
-  const complianceBreakdownEl = document.querySelector('#complianceBreakdown');
-
-  generatedAtEl.textContent = `Last refreshed ${formatDate(generatedAt)} (UTC)`;
-  totalItemsEl.textContent = summary.total_items ?? 0;
-  sourcesEl.textContent = summary.sources?.length
-    ? summary.sources.join(', ')
-    : 'No sources scanned';
-
-  const buildBreakdown = (items = []) =>
-    items
-      .map((item) => `<li><span>${item.label}</span><span>(${item.count})</span></li>`)
-      .join('');
-
-  verticalBreakdownEl.innerHTML = buildBreakdown(summary.vertical_counts);
-  complianceBreakdownEl.innerHTML = buildBreakdown(summary.compliance_counts);
-}
-
-function populateFilters(sections) {
-  const verticalFilter = document.querySelector('#verticalFilter');
-  const complianceFilter = document.querySelector('#complianceFilter');
-
-  const verticalOptions = new Map();
-  const complianceOptions = new Map();
-
-  sections.forEach((section) => {
-    verticalOptions.set(section.vertical.key, section.vertical.label);
-    section.segments.forEach((segment) => {
-      complianceOptions.set(segment.compliance.key, segment.compliance.label);
-    });
-  });
-
-  const addOptions = (select, options) => {
-    options.forEach((label, key) => {
-      const option = document.createElement('option');
-      option.value = key;
-      option.textContent = label;
-      select.appendChild(option);
-    });
-  };
-
-  addOptions(verticalFilter, verticalOptions);
-  addOptions(complianceFilter, complianceOptions);
-
-  verticalFilter.addEventListener('change', renderArticles);
-  complianceFilter.addEventListener('change', renderArticles);
-}
-
-function renderArticles() {
-  const container = document.querySelector('#articlesContainer');
-  if (!state.data) {
-    container.innerHTML = '<p class="loading">No data available.</p>';
-    return;
-  }
-
-  const verticalFilter = document.querySelector('#verticalFilter').value;
-  const complianceFilter = document.querySelector('#complianceFilter').value;
-
-  const sections = state.data.sections;
-  const articleFragments = [];
-
-  sections.forEach((section) => {
-    if (verticalFilter !== 'all' && section.vertical.key !== verticalFilter) {
-      return;
-    }
-
-    const matchingSegments = section.segments.filter((segment) =>
-      complianceFilter === 'all' || segment.compliance.key === complianceFilter,
-    );
-
-    if (!matchingSegments.length) {
-      return;
-    }
-
-    const verticalBlock = document.createElement('div');
-    verticalBlock.className = 'vertical-block';
-
-    const verticalHeader = document.createElement('h3');
-    verticalHeader.textContent = section.vertical.label;
-    verticalBlock.appendChild(verticalHeader);
-
-    matchingSegments.forEach((segment) => {
-      const group = document.createElement('div');
-      group.className = 'compliance-group';
-
-      const header = document.createElement('h4');
-      header.textContent = segment.compliance.label;
-      group.appendChild(header);
-
-      segment.items.forEach((item) => {
-        const card = document.createElement('article');
-        card.className = 'article-card';
-
-        const title = document.createElement('h5');
-        const link = document.createElement('a');
-        link.href = item.link || '#';
-        link.target = '_blank';
-        link.rel = 'noopener noreferrer';
-        link.textContent = item.title;
-        title.appendChild(link);
-        card.appendChild(title);
-
-        const meta = document.createElement('p');
-        meta.className = 'article-meta';
-        meta.textContent = `${item.source} • ${formatDate(item.published)}`;
-        card.appendChild(meta);
-
-        if (item.summary) {
-          const summary = document.createElement('p');
-          summary.className = 'article-summary';
-          summary.textContent = item.summary;
-          card.appendChild(summary);
-        }
-
-        const tags = document.createElement('div');
-        tags.className = 'tags';
-
-        const allTags = [...item.verticals, ...item.compliance];
-        allTags.forEach((tagInfo) => {
-          const tag = document.createElement('span');
-          tag.className = 'tag';
-          tag.textContent = tagInfo.label;
-          tags.appendChild(tag);
-        });
-
-        if (item.keyword_hits) {
-          Object.entries(item.keyword_hits).forEach(([category, mapping]) => {
-            Object.entries(mapping).forEach(([key, hits]) => {
-              if (!hits.length) return;
-              const keyword = document.createElement('span');
-              keyword.className = 'keyword-hit';
-              keyword.textContent = `${category === 'verticals' ? 'Vertical keywords' : 'Compliance keywords'}: ${[
-                ...new Set(hits),
-              ].join(', ')}`;
-              tags.appendChild(keyword);
-            });
-          });
-        }
-
-        if (tags.childElementCount) {
-          card.appendChild(tags);
-        }
-
-        group.appendChild(card);
-      });
-
-      verticalBlock.appendChild(group);
-    });
-
-    articleFragments.push(verticalBlock);
-  });
-
-  container.innerHTML = '';
-
-  if (!articleFragments.length) {
-    container.innerHTML = '<p class="empty-state">No articles match the selected filters.</p>';
-    return;
-  }
-
-  articleFragments.forEach((fragment) => container.appendChild(fragment));
-}
-
-async function init() {
-  const container = document.querySelector('#articlesContainer');
-  try {
-    state.data = await loadData();
-    renderSnapshot(state.data.summary, state.data.generated_at);
-    populateFilters(state.data.sections);
-    renderArticles();
-  } catch (error) {
-    console.error(error);
-    container.innerHTML = '<p class="empty-state">Unable to load the latest report. Please try again later.</p>';
-  }
-}
-
-init();
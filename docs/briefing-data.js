@@ -0,0 +1,310 @@
+// Data helpers shared by the dashboard worker and the main-thread fallback.
+
+export const DATA_URL = 'data/latest.json';
+export const SAMPLE_DATA_URL = 'data/sample.json';
+export const MANIFEST_URL = 'data/manifest.json';
+
+const ARTIFACT_NAME = 'latest.json';
+const CACHE_DB_NAME = 'compliance-briefing';
+const CACHE_STORE = 'payloads';
+const CACHE_KEY = 'latest';
+
+export async function fetchJson(url, { cache = 'no-cache' } = {}) {
+  const response = await fetch(url, { cache });
+  if (!response.ok) {
+    const error = new Error(`Failed to load data (${response.status})`);
+    error.status = response.status;
+    error.url = url;
+    throw error;
+  }
+  return response.json();
+}
+
+function articleKey(item) {
+  return item.id || item.link || item.title || '';
+}
+
+function mergeTags(target, tags) {
+  tags?.forEach((tag) => {
+    if (tag?.key && !target.some((existing) => existing.key === tag.key)) {
+      target.push(tag);
+    }
+  });
+}
+
+// Only the fields the list renders are kept, both in memory and in the cache.
+function toArticle(item, verticalFallback = [], complianceFallback = []) {
+  return {
+    id: articleKey(item),
+    title: item.title,
+    link: item.link,
+    source: item.source,
+    published: item.published,
+    summary: item.summary,
+    verticals: item.verticals?.length ? [...item.verticals] : [...verticalFallback],
+    compliance: item.compliance?.length ? [...item.compliance] : [...complianceFallback],
+  };
+}
+
+// Items appear once per vertical/compliance segment in the payload; collapse
+// them back to one article each.
+function collectArticles(data) {
+  const byKey = new Map();
+
+  data?.sections?.forEach((section) => {
+    const verticalFallback = section?.vertical ? [section.vertical] : [];
+    section.segments?.forEach((segment) => {
+      const complianceFallback = segment?.compliance ? [segment.compliance] : [];
+      segment.items?.forEach((item) => {
+        const key = articleKey(item);
+        const existing = byKey.get(key);
+        if (existing) {
+          mergeTags(existing.verticals, item.verticals?.length ? item.verticals : verticalFallback);
+          mergeTags(existing.compliance, item.compliance?.length ? item.compliance : complianceFallback);
+        } else {
+          byKey.set(key, toArticle(item, verticalFallback, complianceFallback));
+        }
+      });
+    });
+  });
+
+  return Array.from(byKey.values());
+}
+
+function sortArticles(articles) {
+  const timestamps = new Map(
+    articles.map((article) => {
+      const time = new Date(article.published ?? 0).getTime();
+      return [article, Number.isNaN(time) ? 0 : time];
+    }),
+  );
+  return articles.sort((a, b) => timestamps.get(b) - timestamps.get(a));
+}
+
+export function flattenArticles(data) {
+  return sortArticles(collectArticles(data));
+}
+
+// A record is the cacheable form of a payload: its version, header fields,
+// and the flattened articles.
+function recordFromPayload(payload, version) {
+  return {
+    version,
+    generated_at: payload?.generated_at ?? null,
+    summary: payload?.summary ?? {},
+    articles: collectArticles(payload),
+  };
+}
+
+export function applyDelta(record, delta) {
+  if (delta?.from !== record.version) {
+    throw new Error(`Delta ${delta?.from} → ${delta?.to} does not apply to version ${record.version}.`);
+  }
+  const articles = new Map(record.articles.map((article) => [article.id, article]));
+  delta.removed?.forEach((id) => articles.delete(id));
+  [...(delta.added ?? []), ...(delta.changed ?? [])].forEach((item) => {
+    articles.set(articleKey(item), toArticle(item));
+  });
+  return {
+    version: delta.to,
+    generated_at: delta.generated_at ?? record.generated_at,
+    summary: delta.summary ?? record.summary,
+    articles: Array.from(articles.values()),
+  };
+}
+
+// ---------------------------------------------------------------------------
+// IndexedDB cache of the last record. Every failure degrades to "no cache".
+// ---------------------------------------------------------------------------
+function openCache() {
+  if (typeof indexedDB === 'undefined') {
+    return Promise.resolve(null);
+  }
+  return new Promise((resolve) => {
+    let request;
+    try {
+      request = indexedDB.open(CACHE_DB_NAME, 1);
+    } catch (error) {
+      resolve(null);
+      return;
+    }
+    request.onupgradeneeded = () => request.result.createObjectStore(CACHE_STORE);
+    request.onsuccess = () => resolve(request.result);
+    request.onerror = () => resolve(null);
+    request.onblocked = () => resolve(null);
+  });
+}
+
+async function withCacheStore(mode, operation) {
+  const db = await openCache();
+  if (!db) {
+    return null;
+  }
+  return new Promise((resolve) => {
+    try {
+      const transaction = db.transaction(CACHE_STORE, mode);
+      const request = operation(transaction.objectStore(CACHE_STORE));
+      transaction.oncomplete = () => {
+        db.close();
+        resolve(request.result ?? null);
+      };
+      transaction.onerror = () => {
+        db.close();
+        resolve(null);
+      };
+      transaction.onabort = transaction.onerror;
+    } catch (error) {
+      db.close();
+      resolve(null);
+    }
+  });
+}
+
+function readCachedRecord() {
+  return withCacheStore('readonly', (store) => store.get(CACHE_KEY));
+}
+
+function writeCachedRecord(record) {
+  return withCacheStore('readwrite', (store) => store.put(record, CACHE_KEY));
+}
+
+// ---------------------------------------------------------------------------
+// Loading: manifest → cached copy → delta chain → full hashed payload.
+// ---------------------------------------------------------------------------
+async function followDeltaChain(record, entry, manifestUrl) {
+  const byFrom = new Map((entry.deltas ?? []).map((delta) => [delta.from, delta]));
+  const steps = [];
+  let version = record.version;
+  let bytes = 0;
+  while (version !== entry.version) {
+    const step = byFrom.get(version);
+    if (!step || steps.length >= byFrom.size) {
+      return null;
+    }
+    steps.push(step);
+    bytes += step.bytes ?? 0;
+    version = step.to;
+  }
+  if (entry.bytes && bytes >= entry.bytes) {
+    return null;
+  }
+
+  let current = record;
+  for (const step of steps) {
+    // Delta files are immutable, so the HTTP cache may serve them.
+    const delta = await fetchJson(new URL(step.file, manifestUrl).href, { cache: 'default' });
+    current = applyDelta(current, delta);
+  }
+  return current;
+}
+
+async function loadLatestRecord(resolve) {
+  const manifestUrl = resolve(MANIFEST_URL);
+  let entry = null;
+  try {
+    const manifest = await fetchJson(manifestUrl);
+    entry = manifest?.artifacts?.[ARTIFACT_NAME] ?? null;
+  } catch (error) {
+    console.info('Payload manifest unavailable; downloading the full payload.', error);
+  }
+  if (!entry?.version || !entry.file) {
+    return recordFromPayload(await fetchJson(resolve(DATA_URL)), null);
+  }
+
+  const cached = await readCachedRecord();
+  if (cached?.version === entry.version) {
+    return cached;
+  }
+  if (cached?.version) {
+    try {
+      const updated = await followDeltaChain(cached, entry, manifestUrl);
+      if (updated) {
+        await writeCachedRecord(updated);
+        return updated;
+      }
+    } catch (error) {
+      console.warn('Could not apply payload deltas; downloading the full payload.', error);
+    }
+  }
+
+  const payload = await fetchJson(new URL(entry.file, manifestUrl).href, { cache: 'default' });
+  const record = recordFromPayload(payload, entry.version);
+  await writeCachedRecord(record);
+  return record;
+}
+
+export async function loadBriefingRecord(baseUrl) {
+  const resolve = (path) => new URL(path, baseUrl).href;
+  try {
+    const record = await loadLatestRecord(resolve);
+    return { record, usedFallback: false };
+  } catch (primaryError) {
+    console.warn('Primary data request failed. Attempting to use sample payload.', primaryError);
+    try {
+      const fallbackPayload = await fetchJson(resolve(SAMPLE_DATA_URL));
+      return { record: recordFromPayload(fallbackPayload, null), usedFallback: true };
+    } catch (fallbackError) {
+      const error = new Error('Unable to load compliance briefing data.');
+      error.cause = { primaryError, fallbackError };
+      throw error;
+    }
+  }
+}
+
+// Keeps the flattened articles plus precomputed lookup structures so that a
+// filter change is a single pass over typed arrays rather than a DOM rebuild.
+export class BriefingIndex {
+  constructor(articles) {
+    this.articles = articles;
+    this.searchText = articles.map((article) =>
+      [article.title, article.summary, article.source].filter(Boolean).join(' ').toLowerCase(),
+    );
+    this.verticalSets = articles.map((article) => new Set(article.verticals.map((tag) => tag.key)));
+    this.complianceSets = articles.map((article) => new Set(article.compliance.map((tag) => tag.key)));
+    this.facets = BriefingIndex.buildFacets(articles);
+  }
+
+  static buildFacets(articles) {
+    const verticals = new Map();
+    const compliance = new Map();
+    articles.forEach((article) => {
+      article.verticals.forEach((tag) => verticals.set(tag.key, tag.label || tag.key));
+      article.compliance.forEach((tag) => compliance.set(tag.key, tag.label || tag.key));
+    });
+    const toOptions = (map) =>
+      Array.from(map, ([key, label]) => ({ key, label })).sort((a, b) => a.label.localeCompare(b.label));
+    return { verticals: toOptions(verticals), compliance: toOptions(compliance) };
+  }
+
+  query({ vertical = 'all', compliance = 'all', search = '' } = {}) {
+    const terms = search.toLowerCase().split(/\s+/).filter(Boolean);
+    const matches = new Uint32Array(this.articles.length);
+    let count = 0;
+    for (let index = 0; index < this.articles.length; index += 1) {
+      if (vertical !== 'all' && !this.verticalSets[index].has(vertical)) {
+        continue;
+      }
+      if (compliance !== 'all' && !this.complianceSets[index].has(compliance)) {
+        continue;
+      }
+      if (terms.length && !terms.every((term) => this.searchText[index].includes(term))) {
+        continue;
+      }
+      matches[count] = index;
+      count += 1;
+    }
+    return matches.slice(0, count);
+  }
+}
+
+export async function loadBriefingIndex(baseUrl) {
+  const { record, usedFallback } = await loadBriefingRecord(baseUrl);
+  // Copy before sorting so the cached record is never mutated.
+  const index = new BriefingIndex(sortArticles([...record.articles]));
+  const meta = {
+    generated_at: record.generated_at,
+    summary: record.summary,
+    usedFallback,
+  };
+  return { index, meta };
+}
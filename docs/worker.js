@@ -0,0 +1,36 @@
+// Dashboard worker: fetches, parses, flattens, sorts, and filters the briefing
+// payload off the main thread. The page only receives row data once and then
+// index lists for each filter change.
+import { loadBriefingIndex } from './briefing-data.js';
+
+let briefingIndex = null;
+
+self.addEventListener('message', async (event) => {
+  const { type, requestId } = event.data ?? {};
+
+  if (type === 'load') {
+    try {
+      const { index, meta } = await loadBriefingIndex(event.data.baseUrl);
+      briefingIndex = index;
+      self.postMessage({
+        type: 'loaded',
+        requestId,
+        meta,
+        articles: index.articles,
+        facets: index.facets,
+      });
+    } catch (error) {
+      self.postMessage({ type: 'error', requestId, message: error.message });
+    }
+    return;
+  }
+
+  if (type === 'query') {
+    if (!briefingIndex) {
+      self.postMessage({ type: 'error', requestId, message: 'Briefing data has not been loaded.' });
+      return;
+    }
+    const matches = briefingIndex.query(event.data.filters);
+    self.postMessage({ type: 'queried', requestId, matches }, [matches.buffer]);
+  }
+});
@@ -0,0 +1,84 @@
+"""Merge shard snapshots into a single ranked snapshot for rendering."""
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+from contextlib import nullcontext
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent
+if str(ROOT / "src") not in sys.path:
+    sys.path.insert(0, str(ROOT / "src"))
+
+from compliance_agent.agent import ComplianceNewsAgent
+from compliance_agent.profiling import PipelineProfiler
+from compliance_agent.snapshot import SnapshotError
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Combine snapshots written by '--shard I/N --snapshot PATH' runs, deduplicate and"
+            " rank the items globally, and write one snapshot for --from-snapshot rendering."
+        ),
+    )
+    parser.add_argument(
+        "snapshots",
+        nargs="+",
+        type=Path,
+        help="Shard snapshot files to merge (one per shard).",
+    )
+    parser.add_argument(
+        "--output",
+        "-o",
+        type=Path,
+        required=True,
+        help="Path for the merged snapshot.",
+    )
+    parser.add_argument(
+        "--config-dir",
+        type=Path,
+        default=Path("config"),
+        help="Directory containing configuration files.",
+    )
+    parser.add_argument(
+        "--snapshot-max-age",
+        type=int,
+        metavar="MINUTES",
+        default=None,
+        help="Reject shard snapshots older than MINUTES (defaults to config/agent.json; 0 disables the check).",
+    )
+    parser.add_argument(
+        "--profile",
+        type=Path,
+        metavar="DIR",
+        default=None,
+        help="Write per-stage cProfile stats, memory peaks, and flamegraph stacks to DIR.",
+    )
+    parser.add_argument(
+        "--log-level",
+        default="INFO",
+        help="Logging level (DEBUG, INFO, WARNING, ERROR).",
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    logging.basicConfig(
+        level=getattr(logging, args.log_level.upper(), logging.INFO),
+        format="%(asctime)s | %(levelname)s | %(name)s | %(message)s",
+    )
+
+    profiler = PipelineProfiler(args.profile) if args.profile else None
+    with profiler or nullcontext():
+        agent = ComplianceNewsAgent(config_dir=args.config_dir, profiler=profiler)
+        try:
+            agent.merge_snapshots(args.snapshots, args.output, max_age_minutes=args.snapshot_max_age)
+        except (SnapshotError, FileNotFoundError) as exc:
+            raise SystemExit(f"error: {exc}") from exc
+
+
+if __name__ == "__main__":
+    main()
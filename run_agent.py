@@ -4,6 +4,7 @@ from __future__ import annotations
 import argparse
 import logging
 import sys
+from contextlib import nullcontext
 from pathlib import Path
 
 ROOT = Path(__file__).resolve().parent
@@ -11,6 +12,8 @@ if str(ROOT / "src") not in sys.path:
     sys.path.insert(0, str(ROOT / "src"))
 
 from compliance_agent.agent import ComplianceNewsAgent
+from compliance_agent.cli import add_collection_arguments, check_collection_arguments, gather_items
+from compliance_agent.profiling import PipelineProfiler
 
 
 def parse_args() -> argparse.Namespace:
@@ -44,6 +47,7 @@ def parse_args() -> argparse.Namespace:
         default=Path("sample_data"),
         help="Directory containing offline sample articles.",
     )
+    add_collection_arguments(parser)
     parser.add_argument(
         "--log-level",
         default="INFO",
@@ -54,7 +58,16 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Do not print the report to stdout.",
     )
-    return parser.parse_args()
+    parser.add_argument(
+        "--profile",
+        type=Path,
+        metavar="DIR",
+        default=None,
+        help="Write per-stage cProfile stats, memory peaks, and flamegraph stacks to DIR.",
+    )
+    args = parser.parse_args()
+    check_collection_arguments(parser, args)
+    return args
 
 
 def main() -> None:
@@ -64,8 +77,18 @@ def main() -> None:
         format="%(asctime)s | %(levelname)s | %(name)s | %(message)s",
     )
 
-    agent = ComplianceNewsAgent(config_dir=args.config_dir, sample_data_dir=args.sample_data_dir)
-    report = agent.generate_report(output_path=args.output, offline=args.offline, limit=args.limit)
+    profiler = PipelineProfiler(args.profile) if args.profile else None
+    with profiler or nullcontext():
+        agent = ComplianceNewsAgent(
+            config_dir=args.config_dir,
+            sample_data_dir=args.sample_data_dir,
+            profiler=profiler,
+        )
+        items, collected_at = gather_items(args, agent)
+        if args.shard is not None:
+            logging.info("Shard %s collected; render after merging with merge_snapshots.py", args.shard)
+            return
+        report = agent.generate_report(output_path=args.output, items=items, generated_at=collected_at)
 
     if not args.no_print:
         print(report)
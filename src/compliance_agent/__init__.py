@@ -1,6 +1,11 @@
 """Compliance news intelligence agent package."""
 
 from .agent import ComplianceNewsAgent
-from .report import build_markdown_report, build_structured_payload
+from .report import build_markdown_report, build_payload_delta, build_structured_payload
 
-__all__ = ["ComplianceNewsAgent", "build_markdown_report", "build_structured_payload"]
+__all__ = [
+    "ComplianceNewsAgent",
+    "build_markdown_report",
+    "build_payload_delta",
+    "build_structured_payload",
+]
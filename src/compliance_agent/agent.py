@@ -3,18 +3,27 @@ from __future__ import annotations
 
 import json
 import logging
-from datetime import datetime
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Iterable, List
+from typing import Dict, Iterable, Iterator, List, Sequence
 
-from .config import load_agent_config
+from .batch_scoring import score_items
+from .config import config_fingerprint, load_agent_config
 from .filters import apply_topic_matching, filter_relevant_items
-from .models import AgentConfig, NewsItem
-from .news_fetcher import fetch_feed
+from .models import AgentConfig, NewsItem, NewsSource
+from .news_fetcher import download_feed, parse_feed
+from .profiling import PipelineProfiler, profile_stage
 from .report import build_markdown_report
+from .sharding import ShardSpec
+from .snapshot import Snapshot, SnapshotError, load_snapshot, write_snapshot
 
 LOGGER = logging.getLogger(__name__)
 
+DEFAULT_FETCH_WORKERS = 16
+
 
 class ComplianceNewsAgent:
     """Coordinator that loads configuration, collects news, and produces reports."""
@@ -23,9 +32,11 @@ class ComplianceNewsAgent:
         self,
         config_dir: Path | str = Path("config"),
         sample_data_dir: Path | str = Path("sample_data"),
+        profiler: PipelineProfiler | None = None,
     ) -> None:
         self.config_dir = Path(config_dir)
         self.sample_data_dir = Path(sample_data_dir)
+        self.profiler = profiler
         self._config: AgentConfig | None = None
 
     @property
@@ -38,38 +49,296 @@ class ComplianceNewsAgent:
     # ------------------------------------------------------------------
     # Data collection
     # ------------------------------------------------------------------
-    def collect_news(self, offline: bool = False, limit: int | None = None) -> List[NewsItem]:
-        """Fetch news from configured sources, optionally using offline fixtures."""
+    def collect_news(
+        self,
+        offline: bool = False,
+        limit: int | None = None,
+        snapshot_path: Path | str | None = None,
+        shard: ShardSpec | None = None,
+    ) -> List[NewsItem]:
+        """Fetch news from configured sources, optionally using offline fixtures.
+
+        When ``snapshot_path`` is given the full ranked result (before
+        ``limit`` is applied) is also written there for :meth:`load_snapshot`.
+        ``shard`` restricts collection to the sources assigned to that shard;
+        combine shard snapshots with :meth:`merge_snapshots`.
+        """
 
         raw_items: List[NewsItem] = []
-        source_hint_map = {source.name: source.topics for source in self.config.sources}
 
         if offline:
             LOGGER.info("Loading offline fixture data from %s", self.sample_data_dir)
-            raw_items.extend(self._load_offline_items())
-        else:
-            for source in self.config.sources:
-                feed_items = fetch_feed(
-                    source,
-                    timeout=self.config.request_timeout,
-                    max_items=self.config.max_items_per_source or None,
+            with profile_stage(self.profiler, "parse"):
+                raw_items.extend(
+                    item for item in self._load_offline_items() if shard is None or shard.includes(item.source)
                 )
-                raw_items.extend(feed_items)
+        else:
+            for source in self._sources(shard):
+                raw_items.extend(self._fetch_source(source))
 
         LOGGER.info("Collected %s raw items", len(raw_items))
-        for item in raw_items:
-            hints = source_hint_map.get(item.source, ())
-            apply_topic_matching(item, self.config.topics, hints)
-
-        relevant = filter_relevant_items(raw_items)
-        LOGGER.info("Identified %s relevant items", len(relevant))
-        deduped = self._deduplicate(relevant)
-        LOGGER.debug("After deduplication %s items remain", len(deduped))
-        sorted_items = sorted(deduped, key=lambda item: (item.score(), item.published or datetime.min), reverse=True)
+        self._match_items(raw_items)
+
+        with profile_stage(self.profiler, "dedupe"):
+            relevant = filter_relevant_items(raw_items)
+            LOGGER.info("Identified %s relevant items", len(relevant))
+            deduped = self._deduplicate(relevant)
+            LOGGER.debug("After deduplication %s items remain", len(deduped))
+            sorted_items = self._rank(deduped)
+        if snapshot_path is not None:
+            with profile_stage(self.profiler, "serialize"):
+                write_snapshot(
+                    Path(snapshot_path),
+                    sorted_items,
+                    config_fingerprint(self.config_dir),
+                    shard=shard,
+                )
+            LOGGER.info("Snapshot of %s items written to %s", len(sorted_items), snapshot_path)
         if limit is not None:
             sorted_items = sorted_items[:limit]
         return sorted_items
 
+    def load_snapshot(
+        self,
+        snapshot_path: Path | str,
+        limit: int | None = None,
+        max_age_minutes: int | None = None,
+    ) -> Snapshot:
+        """Return the snapshot written by :meth:`collect_news` with its ranked items.
+
+        ``limit`` trims :attr:`Snapshot.items`; :attr:`Snapshot.created_at`
+        tells renderers when the data was actually collected.
+
+        ``max_age_minutes`` defaults to the configured
+        ``snapshot_max_age_minutes``; zero or a negative value disables the
+        staleness check. Raises :class:`~compliance_agent.snapshot.SnapshotError`
+        when the snapshot is too old or was built from different configuration.
+        """
+
+        snapshot = self._read_snapshot(snapshot_path, max_age_minutes)
+        if snapshot.shard is not None:
+            LOGGER.warning(
+                "Snapshot %s only covers shard %s; merge all shards for a complete briefing",
+                snapshot_path,
+                snapshot.shard,
+            )
+        if limit is not None:
+            snapshot.items = snapshot.items[:limit]
+        return snapshot
+
+    def merge_snapshots(
+        self,
+        snapshot_paths: Sequence[Path | str],
+        output_path: Path | str,
+        max_age_minutes: int | None = None,
+    ) -> List[NewsItem]:
+        """Combine shard snapshots into one globally deduplicated, ranked snapshot.
+
+        Every input must match the current configuration. The merged snapshot
+        takes the creation time of its oldest input so staleness checks still
+        reflect the oldest collected data. Raises
+        :class:`~compliance_agent.snapshot.SnapshotError` when the inputs do not
+        form a complete set of shards.
+        """
+
+        if not snapshot_paths:
+            raise ValueError("At least one snapshot is required to merge.")
+        snapshots = [self._read_snapshot(path, max_age_minutes) for path in snapshot_paths]
+        self._check_shard_coverage(snapshots)
+
+        with profile_stage(self.profiler, "dedupe"):
+            combined = [item for snapshot in snapshots for item in snapshot.items]
+            merged = self._rank(self._deduplicate(combined))
+        LOGGER.info(
+            "Merged %s snapshots: %s items, %s after deduplication",
+            len(snapshots),
+            len(combined),
+            len(merged),
+        )
+        with profile_stage(self.profiler, "serialize"):
+            write_snapshot(
+                Path(output_path),
+                merged,
+                config_fingerprint(self.config_dir),
+                created_at=min(snapshot.created_at for snapshot in snapshots),
+            )
+        LOGGER.info("Merged snapshot written to %s", output_path)
+        return merged
+
+    def _read_snapshot(self, snapshot_path: Path | str, max_age_minutes: int | None) -> Snapshot:
+        if max_age_minutes is None:
+            max_age_minutes = self.config.snapshot_max_age_minutes
+        max_age = timedelta(minutes=max_age_minutes) if max_age_minutes and max_age_minutes > 0 else None
+        with profile_stage(self.profiler, "parse"):
+            snapshot = load_snapshot(
+                Path(snapshot_path),
+                config_hash=config_fingerprint(self.config_dir),
+                max_age=max_age,
+            )
+        LOGGER.info(
+            "Loaded %s items from snapshot %s (created %s)",
+            len(snapshot.items),
+            snapshot_path,
+            snapshot.created_at.isoformat(timespec="seconds"),
+        )
+        return snapshot
+
+    @staticmethod
+    def _check_shard_coverage(snapshots: Sequence[Snapshot]) -> None:
+        shards = [snapshot.shard for snapshot in snapshots if snapshot.shard is not None]
+        if not shards:
+            return
+        if len(shards) != len(snapshots):
+            raise SnapshotError("Cannot merge sharded snapshots with unsharded ones.")
+        counts = {shard.count for shard in shards}
+        if len(counts) != 1:
+            raise SnapshotError(f"Snapshots come from different shard counts: {sorted(counts)}.")
+        count = counts.pop()
+        indexes = [shard.index for shard in shards]
+        duplicates = sorted({index for index in indexes if indexes.count(index) > 1})
+        if duplicates:
+            raise SnapshotError(f"Shards given more than once: {duplicates}.")
+        missing = sorted(set(range(1, count + 1)) - set(indexes))
+        if missing:
+            raise SnapshotError(f"Missing shards {missing} of {count}.")
+
+    def iter_news(
+        self,
+        offline: bool = False,
+        limit: int | None = None,
+        max_workers: int | None = None,
+        queue_size: int = 8,
+    ) -> Iterator[NewsItem]:
+        """Yield relevant items as soon as the source they came from has been processed.
+
+        Sources are fetched concurrently and handed over through a bounded
+        queue, so a slow consumer holds back the fetch workers instead of
+        letting results pile up in memory. ``max_workers`` defaults to one
+        worker per source up to :data:`DEFAULT_FETCH_WORKERS`, so the first
+        item arrives as soon as the fastest feed has answered while at most
+        ``max_workers + queue_size`` parsed feeds are held at once. Duplicates are dropped online (the first sighting
+        wins) and items arrive in source completion order; use
+        :meth:`collect_news` when a globally ranked list is needed.
+        """
+
+        seen: set[str] = set()
+        emitted = 0
+        for batch in self._iter_source_batches(offline, max_workers, queue_size):
+            self._match_items(batch)
+            for item in filter_relevant_items(batch):
+                key = self._dedupe_key(item)
+                if key in seen:
+                    continue
+                seen.add(key)
+                yield item
+                emitted += 1
+                if limit is not None and emitted >= limit:
+                    return
+
+    def score_batch(
+        self,
+        items: Sequence[NewsItem],
+        mode: str = "exact",
+        threshold: float = 0.0,
+        limit: int | None = None,
+    ) -> List[NewsItem]:
+        """Match, filter, deduplicate, and rank a large batch of items with NumPy.
+
+        Meant for backfills where per-item matching is too slow. ``mode="exact"``
+        (the default) returns the same items in the same order as the per-item
+        path used by :meth:`collect_news`. ``mode="weighted"`` stores the
+        weighted cluster score described in
+        :func:`~compliance_agent.batch_scoring.score_items` on each item as
+        ``relevance``; :meth:`NewsItem.score` returns it, so ranking,
+        deduplication, and rendered reports all follow the weighted order.
+        Items scoring below ``threshold`` are dropped.
+        """
+
+        source_hint_map = {source.name: source.topics for source in self.config.sources}
+        with profile_stage(self.profiler, "match"):
+            result = score_items(
+                items, self.config.topics, source_hint_map, mode=mode, threshold=threshold
+            )
+
+        with profile_stage(self.profiler, "dedupe"):
+            relevant = [items[index] for index in result.relevant_indices()]
+            ranked = self._rank(self._deduplicate(relevant))
+            LOGGER.info("Batch scoring kept %s of %s items", len(ranked), len(items))
+        if limit is not None:
+            ranked = ranked[:limit]
+        return ranked
+
+    # ------------------------------------------------------------------
+    def _sources(self, shard: ShardSpec | None = None) -> List[NewsSource]:
+        if shard is None:
+            return list(self.config.sources)
+        selected = [source for source in self.config.sources if shard.includes(source.name)]
+        LOGGER.info("Shard %s covers %s of %s sources", shard, len(selected), len(self.config.sources))
+        return selected
+
+    def _fetch_source(self, source: NewsSource) -> List[NewsItem]:
+        with profile_stage(self.profiler, "fetch"):
+            data = download_feed(source, timeout=self.config.request_timeout)
+        if data is None:
+            return []
+        with profile_stage(self.profiler, "parse"):
+            return parse_feed(data, source, max_items=self.config.max_items_per_source or None)
+
+    def _match_items(self, items: Iterable[NewsItem]) -> None:
+        source_hint_map = {source.name: source.topics for source in self.config.sources}
+        with profile_stage(self.profiler, "match"):
+            for item in items:
+                hints = source_hint_map.get(item.source, ())
+                apply_topic_matching(item, self.config.topics, hints)
+
+    def _iter_source_batches(
+        self, offline: bool, max_workers: int | None, queue_size: int
+    ) -> Iterator[List[NewsItem]]:
+        if offline:
+            LOGGER.info("Loading offline fixture data from %s", self.sample_data_dir)
+            with profile_stage(self.profiler, "parse"):
+                offline_items = self._load_offline_items()
+            batches: Dict[str, List[NewsItem]] = {}
+            for item in offline_items:
+                batches.setdefault(item.source, []).append(item)
+            yield from batches.values()
+            return
+
+        sources = list(self.config.sources)
+        if not sources:
+            return
+        results: queue.Queue[List[NewsItem]] = queue.Queue(maxsize=max(1, queue_size))
+        stop = threading.Event()
+
+        def worker(source: NewsSource) -> None:
+            try:
+                items = self._fetch_source(source)
+            except Exception:  # pragma: no cover - keep the stream alive on unexpected errors
+                LOGGER.exception("Unexpected error while processing %s", source.url)
+                items = []
+            while not stop.is_set():
+                try:
+                    results.put(items, timeout=0.1)
+                    return
+                except queue.Full:
+                    continue
+
+        if max_workers is None:
+            max_workers = DEFAULT_FETCH_WORKERS
+        workers = max(1, min(max_workers, len(sources)))
+        executor = ThreadPoolExecutor(
+            max_workers=workers,
+            thread_name_prefix="feed-fetch",
+        )
+        try:
+            for source in sources:
+                executor.submit(worker, source)
+            for _ in sources:
+                yield results.get()
+        finally:
+            stop.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+
     # ------------------------------------------------------------------
     def _load_offline_items(self) -> List[NewsItem]:
         fixture_path = self.sample_data_dir / "offline_articles.json"
@@ -106,24 +375,37 @@ class ComplianceNewsAgent:
     def _deduplicate(items: Iterable[NewsItem]) -> List[NewsItem]:
         seen: dict[str, NewsItem] = {}
         for item in items:
-            key = item.link or item.title
+            key = ComplianceNewsAgent._dedupe_key(item)
             existing = seen.get(key)
             if not existing or item.score() > existing.score():
                 seen[key] = item
         return list(seen.values())
 
+    @staticmethod
+    def _rank(items: Iterable[NewsItem]) -> List[NewsItem]:
+        return sorted(items, key=lambda item: (item.score(), item.published or datetime.min), reverse=True)
+
+    @staticmethod
+    def _dedupe_key(item: NewsItem) -> str:
+        return item.link or item.title
+
     # ------------------------------------------------------------------
     def generate_report(
         self,
         output_path: Path | None = None,
         offline: bool = False,
         limit: int | None = None,
+        items: Sequence[NewsItem] | None = None,
+        generated_at: datetime | None = None,
     ) -> str:
-        items = self.collect_news(offline=offline, limit=limit)
-        report = build_markdown_report(items, self.config.topics, datetime.now())
+        if items is None:
+            items = self.collect_news(offline=offline, limit=limit)
+        with profile_stage(self.profiler, "render"):
+            report = build_markdown_report(items, self.config.topics, generated_at or datetime.now())
         if output_path:
             output_path = Path(output_path)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            output_path.write_text(report, encoding="utf-8")
+            with profile_stage(self.profiler, "serialize"):
+                output_path.parent.mkdir(parents=True, exist_ok=True)
+                output_path.write_text(report, encoding="utf-8")
             LOGGER.info("Report written to %s", output_path)
         return report
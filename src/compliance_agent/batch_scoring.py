@@ -0,0 +1,352 @@
+"""Vectorized relevance scoring for large batches of news items.
+
+:func:`apply_topic_matching` checks every keyword against one item at a time.
+For backfills of many thousands of items this module scores the whole batch
+at once instead:
+
+1. the items are turned into a sparse item × term hit matrix,
+2. that matrix is multiplied by a term × topic matrix built from
+   :class:`~compliance_agent.models.TopicsConfig`,
+3. memberships and scores for every vertical and compliance cluster are
+   derived from the product in one pass, and
+4. a relevance threshold is applied.
+
+Two modes are available. ``"exact"`` uses the same lower-cased substring test
+as :func:`apply_topic_matching`, so memberships, keyword hits, and scores are
+identical to the per-item path. ``"weighted"`` matches whole words and
+phrases, scales each cluster by its configured ``weight``, and gives clusters
+hit by several keywords a logarithmic bonus.
+
+NumPy is an optional dependency and only needed when this module is used.
+"""
+from __future__ import annotations
+
+import logging
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, List, Mapping, Sequence, Tuple
+
+try:  # pragma: no cover - optional dependency
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is not part of the standard library
+    np = None
+
+from .models import NewsItem, TopicsConfig
+
+LOGGER = logging.getLogger(__name__)
+
+SCORING_MODES = ("exact", "weighted")
+DEFAULT_CHUNK_SIZE = 4096
+
+_TOKEN_PATTERN = re.compile(r"\w+|&")
+
+
+@dataclass(slots=True)
+class TopicMatrix:
+    """Term × topic incidence built from the configured keyword clusters.
+
+    Columns are the vertical clusters followed by the compliance clusters, in
+    configuration order. ``counts[t, j]`` is the number of keywords of cluster
+    ``j`` that are recognised by term ``t``.
+    """
+
+    terms: List[Any]
+    topics: List[Tuple[str, str]]
+    counts: Any
+    weights: Any
+    vertical_count: int
+    # (keyword, term index) pairs per topic column, used to report keyword hits.
+    keyword_terms: List[List[Tuple[str, int]]]
+
+
+@dataclass(slots=True)
+class BatchScores:
+    """Per-item results of :func:`score_items`, one row per input item."""
+
+    topics: List[Tuple[str, str]]
+    hit_counts: Any
+    membership: Any
+    scores: Any
+    relevant: Any
+
+    def relevant_indices(self) -> List[int]:
+        """Return the positions of the items that passed the relevance test."""
+
+        return np.flatnonzero(self.relevant).tolist()
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError("Batch scoring requires NumPy; install it with 'pip install numpy'.")
+
+
+def _tokenize(text: str) -> Tuple[str, ...]:
+    return tuple(_TOKEN_PATTERN.findall(text.lower()))
+
+
+def build_topic_matrix(topics: TopicsConfig, mode: str = "exact") -> TopicMatrix:
+    """Build the term × topic matrix used by :func:`score_items`.
+
+    In ``"exact"`` mode a term is a lower-cased keyword; in ``"weighted"``
+    mode it is the tuple of word tokens of the keyword, so ``"zero-day"`` and
+    ``"zero day"`` are the same term.
+    """
+
+    _require_numpy()
+    if mode not in SCORING_MODES:
+        raise ValueError(f"Unknown scoring mode '{mode}'; expected one of {', '.join(SCORING_MODES)}.")
+
+    clusters = [("verticals", key, cluster) for key, cluster in topics.verticals.items()]
+    clusters += [("compliance", key, cluster) for key, cluster in topics.compliance.items()]
+
+    term_index: Dict[Any, int] = {}
+    keyword_terms: List[List[Tuple[str, int]]] = []
+    for _, _, cluster in clusters:
+        pairs: List[Tuple[str, int]] = []
+        for keyword in cluster.keywords:
+            term = keyword.lower() if mode == "exact" else _tokenize(keyword)
+            if not term:
+                LOGGER.warning("Ignoring keyword '%s' in '%s' without word characters", keyword, cluster.key)
+                continue
+            pairs.append((keyword, term_index.setdefault(term, len(term_index))))
+        keyword_terms.append(pairs)
+
+    counts = np.zeros((len(term_index), len(clusters)), dtype=np.int32)
+    for column, pairs in enumerate(keyword_terms):
+        for _, term in pairs:
+            counts[term, column] += 1
+
+    return TopicMatrix(
+        terms=list(term_index),
+        topics=[(category, key) for category, key, _ in clusters],
+        counts=counts,
+        weights=np.array([cluster.weight for _, _, cluster in clusters], dtype=np.float64),
+        vertical_count=len(topics.verticals),
+        keyword_terms=keyword_terms,
+    )
+
+
+def _search_text(item: NewsItem) -> str:
+    return " ".join(part for part in [item.title, item.summary, " ".join(item.raw_categories)] if part)
+
+
+def _substring_hits(texts: Sequence[str], terms: Sequence[str], chunk_size: int) -> Tuple[Any, Any]:
+    # Fixed-width string arrays are allocated per chunk to bound memory use.
+    rows: List[Any] = []
+    cols: List[Any] = []
+    for start in range(0, len(texts), chunk_size):
+        chunk = np.array([" ".join(text.lower().split()) for text in texts[start : start + chunk_size]])
+        for column, term in enumerate(terms):
+            found = np.flatnonzero(np.char.find(chunk, term) >= 0)
+            if found.size:
+                rows.append(found + start)
+                cols.append(np.full(found.size, column, dtype=np.int64))
+    if not rows:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    return np.concatenate(rows), np.concatenate(cols)
+
+
+def _encode(term: Tuple[str, ...], vocabulary: Mapping[str, int], base: int) -> int:
+    code = 0
+    for token in term:
+        code = code * base + vocabulary[token]
+    return code
+
+
+def _phrase_hits(texts: Sequence[str], terms: Sequence[Tuple[str, ...]]) -> Tuple[Any, Any]:
+    # Only tokens that occur in some keyword get an id (1..V); every other
+    # token becomes 0. An n-gram is then encoded as an n-digit number in base
+    # V + 1, which is unique per token sequence, so matching all phrases of
+    # length n is one searchsorted over the encoded windows.
+    vocabulary: Dict[str, int] = {}
+    for term in terms:
+        for token in term:
+            vocabulary.setdefault(token, len(vocabulary) + 1)
+    base = len(vocabulary) + 1
+
+    token_ids: List[int] = []
+    lengths: List[int] = []
+    for text in texts:
+        ids = [vocabulary.get(token, 0) for token in _TOKEN_PATTERN.findall(text.lower())]
+        token_ids.extend(ids)
+        lengths.append(len(ids))
+    ids = np.asarray(token_ids, dtype=np.int64)
+    owner = np.repeat(np.arange(len(texts), dtype=np.int64), lengths)
+
+    by_length: Dict[int, List[int]] = {}
+    for column, term in enumerate(terms):
+        by_length.setdefault(len(term), []).append(column)
+
+    rows: List[Any] = []
+    cols: List[Any] = []
+    for length, columns in by_length.items():
+        if base ** length >= 2**63:
+            raise ValueError(f"Keywords of {length} words are too long for weighted batch scoring.")
+        if ids.size < length:
+            continue
+        codes = np.array([_encode(terms[column], vocabulary, base) for column in columns], dtype=np.int64)
+        order = np.argsort(codes)
+        codes, columns_sorted = codes[order], np.asarray(columns, dtype=np.int64)[order]
+
+        windows = ids.size - length + 1
+        encoded = np.zeros(windows, dtype=np.int64)
+        for offset in range(length):
+            encoded = encoded * base + ids[offset : offset + windows]
+        same_item = owner[:windows] == owner[length - 1 :]
+        position = np.minimum(np.searchsorted(codes, encoded), codes.size - 1)
+        matched = np.flatnonzero(same_item & (codes[position] == encoded))
+        rows.append(owner[matched])
+        cols.append(columns_sorted[position[matched]])
+
+    if not rows:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    return np.concatenate(rows), np.concatenate(cols)
+
+
+def _hint_matrix(
+    items: Sequence[NewsItem],
+    matrix: TopicMatrix,
+    source_hints: Mapping[str, Sequence[str]],
+) -> Any:
+    vertical_columns = {key: column for column, (_, key) in enumerate(matrix.topics[: matrix.vertical_count])}
+    sources = {name: position + 1 for position, name in enumerate(source_hints)}
+    table = np.zeros((len(sources) + 1, len(matrix.topics)), dtype=bool)
+    for name, position in sources.items():
+        for hint in source_hints[name]:
+            if hint in vertical_columns:
+                table[position, vertical_columns[hint]] = True
+    codes = np.fromiter((sources.get(item.source, 0) for item in items), dtype=np.int64, count=len(items))
+    return table[codes]
+
+
+def score_items(
+    items: Sequence[NewsItem],
+    topics: TopicsConfig,
+    source_hints: Mapping[str, Sequence[str]] | None = None,
+    mode: str = "exact",
+    threshold: float = 0.0,
+    apply: bool = True,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> BatchScores:
+    """Score ``items`` against every configured cluster in one vectorized pass.
+
+    ``source_hints`` maps source names to the verticals that source implies,
+    as ``NewsSource.topics`` does for :func:`apply_topic_matching`. An item is
+    relevant when it belongs to at least one vertical and one compliance
+    cluster and its score reaches ``threshold``. In ``"exact"`` mode the score
+    is the number of matched clusters, like :meth:`NewsItem.score`; in
+    ``"weighted"`` mode each matched cluster adds
+    ``weight * (1 + ln(keyword hits))``, and a cluster implied only by a
+    source hint adds its weight.
+
+    With ``apply`` (the default) the match fields of every item are populated
+    as :func:`apply_topic_matching` would. In ``"weighted"`` mode the score is
+    also stored as ``NewsItem.relevance``, which :meth:`NewsItem.score` then
+    returns, so reports rendered from the items keep the weighted ranking.
+    """
+
+    matrix = build_topic_matrix(topics, mode)
+    items = list(items)
+    texts = [_search_text(item) for item in items]
+    if mode == "exact":
+        rows, cols = _substring_hits(texts, matrix.terms, max(1, chunk_size))
+    else:
+        rows, cols = _phrase_hits(texts, matrix.terms)
+
+    # Sparse (item × term) @ (term × topic): every hit is expanded to the
+    # topics its term belongs to and accumulated with a single bincount.
+    topic_count = len(matrix.topics)
+    term_ids, topic_ids = np.nonzero(matrix.counts)
+    entry_counts = matrix.counts[term_ids, topic_ids]
+    starts = np.searchsorted(term_ids, np.arange(len(matrix.terms) + 1))
+    fanout = starts[cols + 1] - starts[cols]
+    preceding = np.cumsum(fanout) - fanout
+    entries = np.repeat(starts[cols] - preceding, fanout) + np.arange(int(fanout.sum()))
+    flat = np.repeat(rows, fanout) * topic_count + topic_ids[entries]
+    hit_counts = np.bincount(flat, weights=entry_counts[entries], minlength=len(items) * topic_count)
+    hit_counts = hit_counts.reshape(len(items), topic_count).astype(np.int32)
+
+    hints = _hint_matrix(items, matrix, source_hints or {})
+    membership = (hit_counts > 0) | hints
+    if mode == "exact":
+        scores = membership.sum(axis=1).astype(np.float64)
+    else:
+        strength = np.where(membership, 1.0 + np.log(np.maximum(hit_counts, 1)), 0.0)
+        scores = strength @ matrix.weights
+    split = matrix.vertical_count
+    relevant = membership[:, :split].any(axis=1) & membership[:, split:].any(axis=1) & (scores >= threshold)
+
+    result = BatchScores(
+        topics=matrix.topics,
+        hit_counts=hit_counts,
+        membership=membership,
+        scores=scores,
+        relevant=relevant,
+    )
+    if apply:
+        relevance = result.scores.tolist() if mode == "weighted" else None
+        _apply_matches(items, matrix, result, rows, cols, source_hints or {}, relevance)
+    LOGGER.debug(
+        "Batch-scored %s items against %s clusters (%s mode): %s relevant",
+        len(items),
+        topic_count,
+        mode,
+        int(relevant.sum()),
+    )
+    return result
+
+
+def _apply_matches(
+    items: Sequence[NewsItem],
+    matrix: TopicMatrix,
+    result: BatchScores,
+    rows: Any,
+    cols: Any,
+    source_hints: Mapping[str, Sequence[str]],
+    relevance: List[float] | None,
+) -> None:
+    # Convert the sparse results to plain lists once; per-row NumPy calls
+    # would cost more than the matching itself.
+    order = np.argsort(rows, kind="stable")
+    cols = cols[order].tolist()
+    hit_bounds = np.searchsorted(rows[order], np.arange(len(items) + 1)).tolist()
+    topic_rows, topic_cols = np.nonzero(result.hit_counts)
+    topic_cols = topic_cols.tolist()
+    topic_bounds = np.searchsorted(topic_rows, np.arange(len(items) + 1)).tolist()
+    has_match = result.membership.any(axis=1).tolist()
+    split = matrix.vertical_count
+    vertical_keys = {key for _, key in matrix.topics[:split]}
+    term_keywords: List[List[Tuple[int, int, str]]] = [[] for _ in matrix.terms]
+    for column, pairs in enumerate(matrix.keyword_terms):
+        for position, (keyword, term) in enumerate(pairs):
+            term_keywords[term].append((column, position, keyword))
+
+    for index, item in enumerate(items):
+        item.vertical_matches = []
+        item.compliance_matches = []
+        item.relevance = relevance[index] if relevance is not None else None
+        keyword_hits: Dict[str, Dict[str, List[str]]] = {}
+        if not has_match[index]:
+            item.keyword_hits = keyword_hits
+            continue
+        found: Dict[int, List[Tuple[int, str]]] = {}
+        for term in set(cols[hit_bounds[index] : hit_bounds[index + 1]]):
+            for column, position, keyword in term_keywords[term]:
+                found.setdefault(column, []).append((position, keyword))
+        for column in topic_cols[topic_bounds[index] : topic_bounds[index + 1]]:
+            category, key = matrix.topics[column]
+            matches = [keyword for _, keyword in sorted(found[column])]
+            if column < split:
+                item.vertical_matches.append(key)
+            else:
+                item.compliance_matches.append(key)
+            keyword_hits.setdefault(category, {})[key] = matches
+        for hint in source_hints.get(item.source, ()):
+            if hint in vertical_keys and hint not in item.vertical_matches:
+                item.vertical_matches.append(hint)
+                keyword_hits.setdefault("verticals", {})[hint] = []
+        item.keyword_hits = {
+            category: keyword_hits[category]
+            for category in ("verticals", "compliance")
+            if category in keyword_hits
+        }
@@ -0,0 +1,88 @@
+"""Command-line options shared by the ``build_site.py`` and ``run_agent.py`` entry points."""
+from __future__ import annotations
+
+import argparse
+from datetime import datetime
+from pathlib import Path
+from typing import List, Tuple
+
+from .agent import ComplianceNewsAgent
+from .models import NewsItem
+from .sharding import ShardSpec
+from .snapshot import SnapshotError
+
+
+def parse_shard(value: str) -> ShardSpec:
+    try:
+        return ShardSpec.parse(value)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(str(exc)) from exc
+
+
+def add_collection_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the ``--snapshot``, ``--from-snapshot``, ``--shard``, and ``--snapshot-max-age`` options."""
+
+    parser.add_argument(
+        "--snapshot",
+        type=Path,
+        metavar="PATH",
+        default=None,
+        help="Also write a snapshot of the matched, ranked items to PATH for later --from-snapshot runs.",
+    )
+    parser.add_argument(
+        "--from-snapshot",
+        type=Path,
+        metavar="PATH",
+        default=None,
+        help="Render from a snapshot written by --snapshot instead of fetching and matching news.",
+    )
+    parser.add_argument(
+        "--shard",
+        type=parse_shard,
+        metavar="I/N",
+        default=None,
+        help=(
+            "Only collect the sources assigned to shard I of N (1-based, stable hash of the"
+            " source name). Requires --snapshot; combine shards with merge_snapshots.py."
+        ),
+    )
+    parser.add_argument(
+        "--snapshot-max-age",
+        type=int,
+        metavar="MINUTES",
+        default=None,
+        help="Reject snapshots older than MINUTES (defaults to config/agent.json; 0 disables the check).",
+    )
+
+
+def check_collection_arguments(parser: argparse.ArgumentParser, args: argparse.Namespace) -> None:
+    """Reject option combinations added by :func:`add_collection_arguments` that cannot work together."""
+
+    if args.shard is not None and args.snapshot is None:
+        parser.error("--shard requires --snapshot so the partial results can be merged later")
+    if args.shard is not None and args.from_snapshot is not None:
+        parser.error("--shard cannot be combined with --from-snapshot")
+
+
+def gather_items(
+    args: argparse.Namespace, agent: ComplianceNewsAgent
+) -> Tuple[List[NewsItem], datetime | None]:
+    """Return the items to render and, for snapshots, when they were collected."""
+
+    if args.from_snapshot is None:
+        items = agent.collect_news(
+            offline=args.offline,
+            limit=args.limit,
+            snapshot_path=args.snapshot,
+            shard=args.shard,
+        )
+        return items, None
+    try:
+        snapshot = agent.load_snapshot(
+            args.from_snapshot,
+            limit=args.limit,
+            max_age_minutes=args.snapshot_max_age,
+        )
+    except (SnapshotError, FileNotFoundError) as exc:
+        raise SystemExit(f"error: {exc}") from exc
+    return snapshot.items, snapshot.created_at
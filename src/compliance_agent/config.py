@@ -1,6 +1,7 @@
 """Configuration helpers for the compliance news agent."""
 from __future__ import annotations
 
+import hashlib
 import json
 from pathlib import Path
 from typing import Any, Dict
@@ -31,7 +32,12 @@ def _build_keyword_sets(raw: Dict[str, Any]) -> Dict[str, KeywordSet]:
             raise ValueError(f"All keywords for '{key}' must be strings.")
         cleaned = [item.strip() for item in keywords if item and item.strip()]
         unique_keywords = tuple(dict.fromkeys(cleaned))
-        keyword_sets[key] = KeywordSet(key=key, label=label, keywords=unique_keywords)
+        weight = value.get("weight", 1.0)
+        if isinstance(weight, bool) or not isinstance(weight, (int, float)) or weight < 0:
+            raise ValueError(f"Weight for '{key}' must be a non-negative number.")
+        keyword_sets[key] = KeywordSet(
+            key=key, label=label, keywords=unique_keywords, weight=float(weight)
+        )
     return keyword_sets
 
 
@@ -74,9 +80,38 @@ def load_agent_config(config_dir: Path) -> AgentConfig:
     agent_settings = _load_json(agent_settings_path) if agent_settings_path.exists() else {}
     request_timeout = agent_settings.get("request_timeout", 20)
     max_items = agent_settings.get("max_items_per_source")
+    snapshot_max_age = agent_settings.get("snapshot_max_age_minutes", 360)
     return AgentConfig(
         sources=sources,
         topics=topics,
         request_timeout=request_timeout,
         max_items_per_source=max_items,
+        snapshot_max_age_minutes=snapshot_max_age,
     )
+
+
+CONFIG_FILES = ("topics.json", "news_sources.json")
+# Settings in agent.json that change which items are collected; timeouts and
+# the snapshot age limit do not, so editing them keeps snapshots valid.
+RESULT_SETTINGS = ("max_items_per_source",)
+
+
+def config_fingerprint(config_dir: Path) -> str:
+    """Return a digest of the configuration that influences collection results.
+
+    Covers the topic and source files in full and the :data:`RESULT_SETTINGS`
+    of ``agent.json``.
+    """
+
+    digest = hashlib.sha256()
+    for name in CONFIG_FILES:
+        path = config_dir / name
+        digest.update(name.encode("utf-8") + b"\0")
+        if path.exists():
+            digest.update(path.read_bytes())
+        digest.update(b"\0")
+    agent_settings_path = config_dir / "agent.json"
+    agent_settings = _load_json(agent_settings_path) if agent_settings_path.exists() else {}
+    settings = {key: agent_settings.get(key) for key in RESULT_SETTINGS}
+    digest.update(b"agent.json\0" + json.dumps(settings, sort_keys=True).encode("utf-8"))
+    return digest.hexdigest()
@@ -29,6 +29,7 @@ def apply_topic_matching(
 
     item.vertical_matches = []
     item.compliance_matches = []
+    item.relevance = None
     search_space = " ".join(
         part for part in [item.title, item.summary, " ".join(item.raw_categories)] if part
     )
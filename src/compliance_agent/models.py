@@ -1,6 +1,7 @@
 """Data structures used by the compliance news agent."""
 from __future__ import annotations
 
+import hashlib
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Dict, List, Mapping, Sequence
@@ -22,6 +23,7 @@ class KeywordSet:
     key: str
     label: str
     keywords: Sequence[str]
+    weight: float = 1.0
 
 
 @dataclass(slots=True)
@@ -37,12 +39,25 @@ class NewsItem:
     vertical_matches: List[str] = field(default_factory=list)
     compliance_matches: List[str] = field(default_factory=list)
     keyword_hits: Dict[str, Dict[str, List[str]]] = field(default_factory=dict)
+    relevance: float | None = None
 
-    def score(self) -> int:
-        """Return an integer score used for sorting relevance."""
+    def score(self) -> float:
+        """Return the score used for sorting relevance.
 
+        This is the weighted ``relevance`` assigned by batch scoring when
+        present, otherwise the number of matched clusters.
+        """
+
+        if self.relevance is not None:
+            return self.relevance
         return len(self.vertical_matches) + len(self.compliance_matches)
 
+    def stable_id(self) -> str:
+        """Return an identifier that stays the same for this article across runs."""
+
+        key = self.link or self.title
+        return hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+
 
 @dataclass(slots=True)
 class TopicsConfig:
@@ -60,3 +75,4 @@ class AgentConfig:
     topics: TopicsConfig
     request_timeout: int = 20
     max_items_per_source: int | None = None
+    snapshot_max_age_minutes: int = 360
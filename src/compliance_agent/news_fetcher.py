@@ -103,18 +103,21 @@ def _extract_categories(element: ET.Element) -> List[str]:
     return categories
 
 
-def fetch_feed(source: NewsSource, timeout: int = 20, max_items: int | None = None) -> List[NewsItem]:
-    """Fetch and parse a feed, returning normalized news items."""
+def download_feed(source: NewsSource, timeout: int = 20) -> bytes | None:
+    """Download the raw feed document, returning ``None`` when the request fails."""
 
     LOGGER.debug("Fetching feed %s", source.url)
-    request = Request(source.url, headers={"User-Agent": "saas-compliance-intelligence/1.0"})
     request = Request(source.url, headers={"User-Agent": "clubessential-compliance-agent/1.0"})
     try:
         with urlopen(request, timeout=timeout) as response:  # type: ignore[call-arg]
-            data = response.read()
+            return response.read()
     except URLError as exc:  # pragma: no cover - network failure path
         LOGGER.warning("Failed to fetch %s: %s", source.url, exc)
-        return []
+        return None
+
+
+def parse_feed(data: bytes, source: NewsSource, max_items: int | None = None) -> List[NewsItem]:
+    """Parse a downloaded feed document into normalized news items."""
 
     entries = _parse_feed_entries(data)
     if max_items is not None:
@@ -139,3 +142,12 @@ def fetch_feed(source: NewsSource, timeout: int = 20, max_items: int | None = No
             )
         )
     return items
+
+
+def fetch_feed(source: NewsSource, timeout: int = 20, max_items: int | None = None) -> List[NewsItem]:
+    """Fetch and parse a feed, returning normalized news items."""
+
+    data = download_feed(source, timeout=timeout)
+    if data is None:
+        return []
+    return parse_feed(data, source, max_items=max_items)
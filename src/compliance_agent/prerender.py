@@ -0,0 +1,307 @@
+"""Server-side rendering of the dashboard pages from the structured payload.
+
+The dashboard template (``docs/index.html``) marks the parts that depend on
+the data with paired comments such as ``<!-- prerender:articles -->`` and
+``<!-- /prerender:articles -->``. :func:`render_dashboard` replaces what sits
+between each pair and keeps the markers, so a page can be rendered again in
+place. Each vertical section of the payload also gets a standalone page
+under ``verticals/``. The markup mirrors what ``app.js`` builds, so the
+script only has to take over once the data has loaded, and the pages stay
+readable with JavaScript disabled.
+"""
+from __future__ import annotations
+
+import logging
+import re
+from datetime import datetime, timezone
+from html import escape
+from pathlib import Path
+from string import Template
+from typing import Any, Dict, List, Mapping, Sequence
+
+from .report import payload_item_key, payload_items
+from .site_output import write_if_changed
+
+LOGGER = logging.getLogger(__name__)
+
+PAGE_SIZE = 25
+VERTICALS_DIR = "verticals"
+
+_VERTICAL_PAGE = Template(
+    """<!DOCTYPE html>
+<html lang="en">
+  <head>
+    <meta charset="utf-8" />
+    <meta name="viewport" content="width=device-width, initial-scale=1" />
+    <title>$label · SaaS Compliance Intelligence</title>
+    <link rel="stylesheet" href="../styles.css" />
+  </head>
+  <body>
+    <div class="page">
+      <header class="masthead">
+        <div class="masthead-inner">
+          <div class="masthead-copy">
+            <h1>SaaS Compliance Intelligence</h1>
+            <p class="tagline">$label briefing, grouped by compliance lens.</p>
+          </div>
+          <div class="masthead-controls">
+            <a class="refresh-button" href="../index.html">Open the dashboard</a>
+            <p class="meta">$generated_at</p>
+          </div>
+        </div>
+      </header>
+      <main class="content">
+        <section class="briefing" aria-labelledby="verticalHeading">
+          <h2 id="verticalHeading">$label</h2>
+          <p class="meta result-count">$count</p>
+$segments
+        </section>
+        <nav class="briefing vertical-pages" aria-label="Briefing by vertical">
+          <h2>Other verticals</h2>
+$navigation
+        </nav>
+      </main>
+      <footer class="footer">
+        <div class="footer-inner">
+          <p>Maintained by the global compliance operations team.</p>
+          <p class="meta">This page is regenerated with the daily briefing.</p>
+        </div>
+      </footer>
+    </div>
+  </body>
+</html>
+"""
+)
+
+
+# ---------------------------------------------------------------------------
+# Payload helpers
+# ---------------------------------------------------------------------------
+def _merge_tags(target: List[Mapping[str, Any]], tags: Sequence[Mapping[str, Any]]) -> None:
+    for tag in tags:
+        if tag.get("key") and not any(existing.get("key") == tag["key"] for existing in target):
+            target.append(tag)
+
+
+def _timestamp(value: str | None) -> float:
+    if not value:
+        return 0.0
+    try:
+        return datetime.fromisoformat(value).timestamp()
+    except (ValueError, OverflowError):
+        return 0.0
+
+
+def flatten_articles(payload: Mapping[str, Any]) -> List[Dict[str, Any]]:
+    """Collapse the grouped payload into one article per item, newest first.
+
+    Matches ``flattenArticles`` in ``docs/briefing-data.js`` so the
+    prerendered first page shows the same articles the dashboard lists first.
+    """
+
+    articles: Dict[str, Dict[str, Any]] = {}
+    for section in payload.get("sections") or []:
+        vertical_fallback = [section["vertical"]] if section.get("vertical") else []
+        for segment in section.get("segments") or []:
+            compliance_fallback = [segment["compliance"]] if segment.get("compliance") else []
+            for item in segment.get("items") or []:
+                verticals = item.get("verticals") or vertical_fallback
+                compliance = item.get("compliance") or compliance_fallback
+                existing = articles.get(payload_item_key(item))
+                if existing:
+                    _merge_tags(existing["verticals"], verticals)
+                    _merge_tags(existing["compliance"], compliance)
+                else:
+                    articles[payload_item_key(item)] = {
+                        **item,
+                        "verticals": list(verticals),
+                        "compliance": list(compliance),
+                    }
+    return sorted(articles.values(), key=lambda article: _timestamp(article.get("published")), reverse=True)
+
+
+def vertical_page_name(key: str) -> str:
+    """Return the file name of the standalone page for vertical ``key``."""
+
+    slug = re.sub(r"[^a-z0-9_-]+", "-", key.lower()).strip("-")
+    return f"{slug or 'vertical'}.html"
+
+
+# ---------------------------------------------------------------------------
+# Markup
+# ---------------------------------------------------------------------------
+def _format_date(value: str | None, include_time: bool = False) -> str:
+    if not value:
+        return "Date unavailable"
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return value
+    text = f"{parsed:%b} {parsed.day}, {parsed.year}"
+    if include_time:
+        if parsed.tzinfo is not None:
+            parsed = parsed.astimezone(timezone.utc)
+        text += f", {parsed:%I:%M %p} UTC"
+    return text
+
+
+def _generated_text(payload: Mapping[str, Any]) -> str:
+    generated_at = payload.get("generated_at")
+    if not generated_at:
+        return "Last refreshed: unavailable"
+    return f"Last refreshed {_format_date(generated_at, include_time=True)}"
+
+
+def render_article(item: Mapping[str, Any], heading: str = "h3") -> str:
+    """Return the markup ``createArticleElement`` in ``docs/app.js`` produces for ``item``."""
+
+    parts = [
+        '<article class="briefing-item">',
+        f'<{heading}><a href="{escape(item.get("link") or "#")}" target="_blank" rel="noopener noreferrer">'
+        f'{escape(item.get("title") or "Untitled update")}</a></{heading}>',
+    ]
+    pills = [
+        f'<span class="vertical-pill" data-vertical="{escape(tag.get("key") or "default")}">'
+        f'{escape(tag["label"])}</span>'
+        for tag in item.get("verticals") or []
+        if tag.get("label")
+    ]
+    if pills:
+        parts.append(f'<div class="briefing-verticals">{"".join(pills)}</div>')
+    source = item.get("source") or "Source unavailable"
+    parts.append(f'<p class="briefing-meta">{escape(source)} · {escape(_format_date(item.get("published")))}</p>')
+    if item.get("summary"):
+        parts.append(f'<p class="briefing-summary">{escape(item["summary"])}</p>')
+    labels = [tag["label"] for tag in item.get("compliance") or [] if tag.get("label")]
+    if labels:
+        parts.append(f'<p class="briefing-compliance">Compliance focus: {escape(" · ".join(labels))}</p>')
+    parts.append("</article>")
+    return "".join(parts)
+
+
+def _vertical_links(payload: Mapping[str, Any], prefix: str, current: str | None = None) -> str:
+    links = []
+    for section in payload.get("sections") or []:
+        vertical = section.get("vertical") or {}
+        key = vertical.get("key")
+        if not key or key == current:
+            continue
+        label = escape(vertical.get("label") or key)
+        href = escape(prefix + vertical_page_name(key))
+        count = len(payload_items([section]))
+        links.append(f'<li><a href="{href}">{label}</a> <span class="meta">({count})</span></li>')
+    if not links:
+        message = "No other verticals" if current else "No vertical pages were"
+        return f'<p class="meta">{message} published in the latest run.</p>'
+    return "<ul>" + "".join(links) + "</ul>"
+
+
+def _fill_region(html: str, name: str, content: str) -> str:
+    pattern = re.compile(
+        rf"(<!-- prerender:{re.escape(name)} -->).*?(<!-- /prerender:{re.escape(name)} -->)",
+        re.DOTALL,
+    )
+    html, count = pattern.subn(lambda match: match.group(1) + content + match.group(2), html)
+    if count != 1:
+        raise ValueError(f"Dashboard template must contain exactly one '{name}' prerender region, found {count}.")
+    return html
+
+
+def render_dashboard(template: str, payload: Mapping[str, Any], page_size: int = PAGE_SIZE) -> str:
+    """Fill the prerender regions of the dashboard ``template`` from ``payload``."""
+
+    summary = payload.get("summary") or {}
+    sources = [str(source) for source in summary.get("sources") or []]
+    articles = flatten_articles(payload)
+    shown = articles[: max(0, page_size)]
+
+    if not articles:
+        article_markup = '<p class="empty-state">No updates were published in the latest run.</p>'
+        result_count = "Showing all 0 updates"
+    else:
+        article_markup = "".join(render_article(item) for item in shown)
+        if len(shown) == len(articles):
+            result_count = f"Showing all {len(articles)} updates"
+        else:
+            result_count = f"Showing the latest {len(shown)} of {len(articles)} updates"
+
+    regions = {
+        "generated-at": _generated_text(payload),
+        "total-items": str(summary.get("total_items", len(articles))),
+        "source-count": str(len(sources)),
+        "sources": f"Sources: {' • '.join(sources)}" if sources else "No sources captured in the latest run.",
+        "result-count": result_count,
+        "articles": article_markup,
+        "vertical-pages": _vertical_links(payload, prefix=f"{VERTICALS_DIR}/"),
+    }
+    html = template
+    for name, content in regions.items():
+        html = _fill_region(html, name, content if name in {"articles", "vertical-pages"} else escape(content))
+    return html
+
+
+def render_vertical_pages(payload: Mapping[str, Any]) -> Dict[str, str]:
+    """Return one standalone page per vertical section, keyed by file name."""
+
+    pages: Dict[str, str] = {}
+    generated_at = escape(_generated_text(payload))
+    for section in payload.get("sections") or []:
+        vertical = section.get("vertical") or {}
+        key = vertical.get("key")
+        if not key:
+            continue
+        segments = []
+        for position, segment in enumerate(section.get("segments") or [], start=1):
+            compliance = segment.get("compliance") or {}
+            items = segment.get("items") or []
+            articles = "".join(render_article(item, heading="h4") for item in items)
+            segments.append(
+                f'          <section class="briefing-segment" aria-labelledby="segment-{position}">'
+                f'<h3 id="segment-{position}">{escape(compliance.get("label") or compliance.get("key") or "")}'
+                f' <span class="meta">({len(items)})</span></h3>'
+                f'<div class="briefing-list">{articles}</div></section>'
+            )
+        count = len(payload_items([section]))
+        pages[vertical_page_name(key)] = _VERTICAL_PAGE.substitute(
+            label=escape(vertical.get("label") or key),
+            generated_at=generated_at,
+            count=f"{count} update{'s' if count != 1 else ''}",
+            segments="\n".join(segments),
+            navigation="          " + _vertical_links(payload, prefix="", current=key),
+        )
+    return pages
+
+
+def write_prerendered_site(
+    output_path: Path,
+    template_path: Path,
+    payload: Mapping[str, Any],
+    page_size: int = PAGE_SIZE,
+) -> List[Path]:
+    """Render the dashboard and vertical pages and return the files that changed.
+
+    The dashboard goes to ``output_path`` and the vertical pages to a
+    ``verticals`` directory next to it, which is created even when the
+    payload has no sections; pages for verticals that no longer appear in
+    the payload are removed. ``template_path`` may be the same file
+    as ``output_path``.
+    """
+
+    output_path = Path(output_path)
+    template_path = Path(template_path)
+    if not template_path.exists():
+        raise FileNotFoundError(f"Dashboard template not found: {template_path}")
+    template = template_path.read_text(encoding="utf-8")
+
+    outputs: Dict[Path, str] = {output_path: render_dashboard(template, payload, page_size)}
+    vertical_dir = output_path.parent / VERTICALS_DIR
+    vertical_dir.mkdir(parents=True, exist_ok=True)
+    for name, html in render_vertical_pages(payload).items():
+        outputs[vertical_dir / name] = html
+
+    changed = [path for path, html in outputs.items() if write_if_changed(path, html.encode("utf-8"))]
+    for candidate in vertical_dir.glob("*.html"):
+        if candidate not in outputs:
+            LOGGER.debug("Removing stale vertical page %s", candidate)
+            candidate.unlink()
+    return changed
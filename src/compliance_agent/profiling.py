@@ -0,0 +1,232 @@
+"""Opt-in profiling for the command-line entry points.
+
+``PipelineProfiler`` collects three kinds of evidence while a run executes:
+
+* cProfile statistics for each pipeline stage (fetch, parse, match, dedupe,
+  render, serialize),
+* tracemalloc peaks per stage plus the top allocation sites of the run, and
+* sampled call stacks in the collapsed format understood by flamegraph tools.
+
+Everything is written to a single directory when the profiler stops.
+"""
+from __future__ import annotations
+
+import cProfile
+import io
+import json
+import logging
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager, nullcontext
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from types import FrameType
+from typing import ContextManager, Dict, Iterator, List
+
+LOGGER = logging.getLogger(__name__)
+
+PIPELINE_STAGES = ("fetch", "parse", "match", "dedupe", "render", "serialize")
+
+
+@dataclass(slots=True)
+class StageStats:
+    """Aggregated measurements for one pipeline stage."""
+
+    calls: int = 0
+    wall_seconds: float = 0.0
+    peak_bytes: int = 0
+
+
+class PipelineProfiler:
+    """Collect per-stage CPU, memory, and stack samples for a single run."""
+
+    def __init__(
+        self,
+        output_dir: Path | str,
+        sample_interval: float = 0.005,
+        top_allocations: int = 25,
+        top_functions: int = 40,
+    ) -> None:
+        self.output_dir = Path(output_dir)
+        self.sample_interval = sample_interval
+        self.top_allocations = top_allocations
+        self.top_functions = top_functions
+        self._stats: Dict[str, StageStats] = {}
+        self._profiles: Dict[str, cProfile.Profile] = {}
+        self._stage_stacks: Dict[int, List[str]] = {}
+        self._samples: Counter[str] = Counter()
+        self._lock = threading.Lock()
+        self._owner_thread: int | None = None
+        self._sampler: threading.Thread | None = None
+        self._stop_sampling = threading.Event()
+        self._run_peak = 0
+        self._started_at = 0.0
+        self._elapsed = 0.0
+
+    # ------------------------------------------------------------------
+    def __enter__(self) -> "PipelineProfiler":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        self._owner_thread = threading.get_ident()
+        self._started_at = time.perf_counter()
+        tracemalloc.start(25)
+        self._stop_sampling.clear()
+        self._sampler = threading.Thread(
+            target=self._sample_stacks, name="profile-sampler", daemon=True
+        )
+        self._sampler.start()
+
+    def stop(self) -> None:
+        self._elapsed = time.perf_counter() - self._started_at
+        self._stop_sampling.set()
+        if self._sampler is not None:
+            self._sampler.join()
+        snapshot = tracemalloc.take_snapshot()
+        self._run_peak = max(self._run_peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+        self._write_reports(snapshot)
+        LOGGER.info("Profile written to %s", self.output_dir)
+
+    # ------------------------------------------------------------------
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Attribute the enclosed work to the pipeline stage ``name``.
+
+        Wall time and stack samples are recorded for every thread; cProfile
+        and tracemalloc peaks only for the thread that started the profiler,
+        because cProfile can observe just one thread at a time.
+        """
+
+        thread_id = threading.get_ident()
+        owner = thread_id == self._owner_thread
+        with self._lock:
+            stack = self._stage_stacks.setdefault(thread_id, [])
+            outer = stack[-1] if stack else None
+            stack.append(name)
+            stats = self._stats.setdefault(name, StageStats())
+
+        profile: cProfile.Profile | None = None
+        if owner:
+            if outer is not None:
+                self._profiles[outer].disable()
+            self._run_peak = max(self._run_peak, tracemalloc.get_traced_memory()[1])
+            tracemalloc.reset_peak()
+            profile = self._profiles.setdefault(name, cProfile.Profile())
+            profile.enable()
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            if profile is not None:
+                profile.disable()
+                peak = tracemalloc.get_traced_memory()[1]
+                self._run_peak = max(self._run_peak, peak)
+                stats.peak_bytes = max(stats.peak_bytes, peak)
+                if outer is not None:
+                    self._profiles[outer].enable()
+            with self._lock:
+                stack.pop()
+                stats.calls += 1
+                stats.wall_seconds += elapsed
+
+    # ------------------------------------------------------------------
+    def _sample_stacks(self) -> None:
+        sampler_id = threading.get_ident()
+        while not self._stop_sampling.wait(self.sample_interval):
+            frames = sys._current_frames()
+            with self._lock:
+                stage_names = {
+                    thread_id: stack[-1] for thread_id, stack in self._stage_stacks.items() if stack
+                }
+            for thread_id, frame in frames.items():
+                if thread_id == sampler_id:
+                    continue
+                stage_name = stage_names.get(thread_id, "other")
+                self._samples[";".join([stage_name, *_collapse_frame(frame)])] += 1
+
+    def _write_reports(self, snapshot: tracemalloc.Snapshot) -> None:
+        stages_dir = self.output_dir / "stages"
+        stages_dir.mkdir(parents=True, exist_ok=True)
+
+        for name, profile in self._profiles.items():
+            profile.dump_stats(str(stages_dir / f"{name}.prof"))
+            buffer = io.StringIO()
+            stats = pstats.Stats(profile, stream=buffer)
+            stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(self.top_functions)
+            (stages_dir / f"{name}.txt").write_text(buffer.getvalue(), encoding="utf-8")
+
+        snapshot = snapshot.filter_traces(
+            (
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, __file__),
+            )
+        )
+        lines = [f"Peak traced memory: {_format_bytes(self._run_peak)}", ""]
+        lines.append("Peak traced memory by stage:")
+        for name, stats in self._ordered_stats():
+            lines.append(f"  {name:<10} {_format_bytes(stats.peak_bytes)}")
+        lines.append("")
+        lines.append(f"Top {self.top_allocations} allocation sites still held at exit:")
+        for statistic in snapshot.statistics("lineno")[: self.top_allocations]:
+            frame = statistic.traceback[0]
+            lines.append(
+                f"  {_format_bytes(statistic.size):>10}  {statistic.count:>8} blocks  "
+                f"{frame.filename}:{frame.lineno}"
+            )
+        (self.output_dir / "memory.txt").write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+        collapsed = "".join(f"{stack} {count}\n" for stack, count in sorted(self._samples.items()))
+        (self.output_dir / "stacks.collapsed").write_text(collapsed, encoding="utf-8")
+
+        summary = {
+            "wall_seconds": round(self._elapsed, 6),
+            "peak_bytes": self._run_peak,
+            "sample_interval": self.sample_interval,
+            "samples": sum(self._samples.values()),
+            "stages": {name: asdict(stats) for name, stats in self._ordered_stats()},
+        }
+        (self.output_dir / "summary.json").write_text(
+            json.dumps(summary, indent=2) + "\n", encoding="utf-8"
+        )
+
+    def _ordered_stats(self) -> List[tuple[str, StageStats]]:
+        order = {name: index for index, name in enumerate(PIPELINE_STAGES)}
+        return sorted(self._stats.items(), key=lambda pair: (order.get(pair[0], len(order)), pair[0]))
+
+
+def profile_stage(profiler: PipelineProfiler | None, name: str) -> ContextManager[None]:
+    """Return ``profiler.stage(name)`` or a no-op context when profiling is off."""
+
+    if profiler is None:
+        return nullcontext()
+    return profiler.stage(name)
+
+
+def _collapse_frame(frame: FrameType | None) -> List[str]:
+    labels: List[str] = []
+    while frame is not None:
+        code = frame.f_code
+        labels.append(f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})")
+        frame = frame.f_back
+    labels.reverse()
+    return labels
+
+
+def _format_bytes(size: int) -> str:
+    value = float(size)
+    for unit in ("B", "KiB", "MiB"):
+        if abs(value) < 1024:
+            return f"{value:.1f} {unit}"
+        value /= 1024
+    return f"{value:.1f} GiB"
@@ -4,7 +4,7 @@ from __future__ import annotations
 from collections import Counter, defaultdict
 from datetime import datetime
 from textwrap import fill
-from typing import Dict, Iterable, List
+from typing import Any, Dict, Iterable, List, Mapping
 
 from .models import NewsItem, TopicsConfig
 
@@ -116,6 +116,7 @@ def _serialize_item(item: NewsItem, topics: TopicsConfig) -> Dict[str, object]:
     verticals = item.vertical_matches or ["unclassified"]
     compliance = item.compliance_matches or ["unclassified"]
     return {
+        "id": item.stable_id(),
         "title": item.title,
         "link": item.link,
         "source": item.source,
@@ -210,3 +211,62 @@ def build_structured_payload(
         "summary": summary,
         "sections": sections,
     }
+
+
+def payload_item_key(item: Mapping[str, Any]) -> str:
+    """Return the key that identifies ``item`` across payloads and pages."""
+
+    return item.get("id") or item.get("link") or item.get("title") or ""
+
+
+def payload_items(sections: Iterable[Mapping[str, Any]]) -> Dict[str, Mapping[str, Any]]:
+    """Return the distinct items of the payload ``sections``, keyed by :func:`payload_item_key`."""
+
+    items: Dict[str, Mapping[str, Any]] = {}
+    for section in sections:
+        for segment in section.get("segments") or []:
+            for item in segment.get("items") or []:
+                items.setdefault(payload_item_key(item), item)
+    return items
+
+
+def build_payload_delta(
+    previous: Mapping[str, Any],
+    current: Mapping[str, Any],
+    from_version: str,
+    to_version: str,
+) -> Dict[str, object]:
+    """Describe how ``current`` differs from ``previous`` item by item.
+
+    Items are keyed by their stable ``id``; the delta carries the full
+    ``summary`` of the new payload because it is small and always changes
+    together with the items.
+    """
+
+    previous_items = payload_items(previous.get("sections") or [])
+    current_items = payload_items(current.get("sections") or [])
+
+    added = [item for key, item in current_items.items() if key not in previous_items]
+    changed = [
+        item
+        for key, item in current_items.items()
+        if key in previous_items and previous_items[key] != item
+    ]
+    removed = sorted(key for key in previous_items if key not in current_items)
+
+    return {
+        "from": from_version,
+        "to": to_version,
+        "generated_at": current.get("generated_at"),
+        "summary": current.get("summary", {}),
+        "counts": {
+            "added": len(added),
+            "changed": len(changed),
+            "removed": len(removed),
+            "unchanged": len(current_items) - len(added) - len(changed),
+            "total": len(current_items),
+        },
+        "added": added,
+        "changed": changed,
+        "removed": removed,
+    }
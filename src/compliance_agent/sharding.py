@@ -0,0 +1,50 @@
+"""Deterministic partitioning of news sources across collection shards."""
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class ShardSpec:
+    """Select shard ``index`` (1-based) out of ``count`` shards."""
+
+    index: int
+    count: int
+
+    def __post_init__(self) -> None:
+        if self.count < 1:
+            raise ValueError("Shard count must be at least 1.")
+        if not 1 <= self.index <= self.count:
+            raise ValueError(f"Shard index must be between 1 and {self.count}.")
+
+    @classmethod
+    def parse(cls, value: str) -> "ShardSpec":
+        """Parse the ``i/n`` notation used on the command line."""
+
+        index, sep, count = value.partition("/")
+        if not sep:
+            raise ValueError(f"Shard must be written as i/n, got '{value}'.")
+        try:
+            return cls(index=int(index), count=int(count))
+        except ValueError as exc:
+            raise ValueError(f"Invalid shard '{value}': {exc}") from exc
+
+    def includes(self, source_name: str) -> bool:
+        """Return whether the source called ``source_name`` belongs to this shard."""
+
+        return shard_for(source_name, self.count) == self.index
+
+    def __str__(self) -> str:
+        return f"{self.index}/{self.count}"
+
+
+def shard_for(source_name: str, count: int) -> int:
+    """Return the 1-based shard a source is assigned to.
+
+    The assignment hashes the source name, so it is stable across machines,
+    Python processes, and the order of entries in ``news_sources.json``.
+    """
+
+    digest = hashlib.sha256(source_name.encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big") % count + 1
@@ -0,0 +1,259 @@
+"""Incremental, content-addressed writers for the static site artifacts."""
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import logging
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Mapping
+
+try:  # pragma: no cover - optional dependency
+    import brotli
+except ImportError:  # pragma: no cover - brotli is not part of the standard library
+    brotli = None
+
+LOGGER = logging.getLogger(__name__)
+
+MANIFEST_NAME = "manifest.json"
+HASH_LENGTH = 12
+DELTA_HISTORY = 10
+
+
+@dataclass(slots=True)
+class PublishedArtifact:
+    """Outcome of publishing a single artifact."""
+
+    path: Path
+    hashed_path: Path
+    sha256: str
+    version: str
+    changed: bool
+    encodings: List[str] = field(default_factory=list)
+
+
+def content_digest(data: bytes) -> str:
+    """Return the hex SHA-256 digest of ``data``."""
+
+    return hashlib.sha256(data).hexdigest()
+
+
+def payload_fingerprint(payload: Mapping[str, Any]) -> str:
+    """Digest the structured payload while ignoring its run timestamp."""
+
+    stable = {key: value for key, value in payload.items() if key != "generated_at"}
+    encoded = json.dumps(stable, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    return content_digest(encoded)
+
+
+def version_of(fingerprint: str) -> str:
+    """Return the short version identifier derived from an artifact fingerprint."""
+
+    return fingerprint[:HASH_LENGTH]
+
+
+def hashed_filename(path: Path, digest: str) -> str:
+    """Return the content-addressed sibling name for ``path``."""
+
+    return f"{path.stem}.{digest[:HASH_LENGTH]}{path.suffix}"
+
+
+def load_manifest(directory: Path) -> Dict[str, Any]:
+    manifest_path = directory / MANIFEST_NAME
+    if not manifest_path.exists():
+        return {"artifacts": {}}
+    try:
+        with manifest_path.open("r", encoding="utf-8") as handle:
+            manifest = json.load(handle)
+    except (OSError, ValueError) as exc:
+        LOGGER.warning("Ignoring unreadable manifest %s: %s", manifest_path, exc)
+        return {"artifacts": {}}
+    if not isinstance(manifest, dict) or not isinstance(manifest.get("artifacts"), dict):
+        LOGGER.warning("Ignoring malformed manifest %s", manifest_path)
+        return {"artifacts": {}}
+    return manifest
+
+
+def save_manifest(directory: Path, manifest: Mapping[str, Any]) -> bool:
+    encoded = (json.dumps(manifest, indent=2, sort_keys=True) + "\n").encode("utf-8")
+    return write_if_changed(directory / MANIFEST_NAME, encoded)
+
+
+def write_if_changed(path: Path, data: bytes) -> bool:
+    """Write ``data`` atomically unless ``path`` already holds the same bytes."""
+
+    if path.exists() and path.stat().st_size == len(data) and path.read_bytes() == data:
+        return False
+    path.parent.mkdir(parents=True, exist_ok=True)
+    staging = path.with_name(path.name + ".tmp")
+    staging.write_bytes(data)
+    staging.replace(path)
+    return True
+
+
+def _expected_encodings(precompress: bool) -> List[str]:
+    if not precompress:
+        return []
+    return ["gzip", "br"] if brotli is not None else ["gzip"]
+
+
+def _compressed_variants(data: bytes) -> Dict[str, bytes]:
+    # ``mtime=0`` keeps the gzip header stable so identical input yields identical bytes.
+    variants = {"gzip": gzip.compress(data, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        variants["br"] = brotli.compress(data, quality=11)
+    return variants
+
+
+_ENCODING_SUFFIXES = {"gzip": ".gz", "br": ".br"}
+
+
+def _prune_stale_versions(path: Path, keep: str) -> None:
+    pattern = re.compile(
+        rf"^{re.escape(path.stem)}\.[0-9a-f]{{{HASH_LENGTH}}}{re.escape(path.suffix)}(\.gz|\.br)?$"
+    )
+    for candidate in path.parent.iterdir():
+        if pattern.match(candidate.name) and not candidate.name.startswith(keep):
+            LOGGER.debug("Removing stale artifact %s", candidate)
+            candidate.unlink()
+
+
+def publish_artifact(
+    path: Path,
+    data: bytes,
+    fingerprint: str | None = None,
+    precompress: bool = True,
+    force: bool = False,
+) -> PublishedArtifact:
+    """Publish ``data`` at ``path`` plus a content-hashed copy and compressed siblings.
+
+    ``fingerprint`` identifies the meaningful content of the artifact; when it
+    matches the manifest entry from the previous run nothing is written, so
+    volatile fields such as timestamps do not cause churn on their own.
+    """
+
+    path = Path(path)
+    directory = path.parent
+    manifest = load_manifest(directory)
+    artifacts: Dict[str, Any] = manifest["artifacts"]
+    digest = content_digest(data)
+    fingerprint = fingerprint or digest
+
+    previous = artifacts.get(path.name)
+    if (
+        not force
+        and previous
+        and previous.get("fingerprint") == fingerprint
+        and list(previous.get("encodings", [])) == _expected_encodings(precompress)
+        and path.exists()
+        and (directory / previous.get("file", "")).is_file()
+    ):
+        LOGGER.info("%s unchanged since last run; skipping write", path)
+        return PublishedArtifact(
+            path=path,
+            hashed_path=directory / previous["file"],
+            sha256=previous.get("sha256", ""),
+            version=version_of(fingerprint),
+            changed=False,
+            encodings=list(previous.get("encodings", [])),
+        )
+
+    hashed_path = path.with_name(hashed_filename(path, digest))
+    outputs: Dict[Path, bytes] = {path: data, hashed_path: data}
+    encodings: List[str] = []
+    if precompress:
+        for encoding, compressed in _compressed_variants(data).items():
+            suffix = _ENCODING_SUFFIXES[encoding]
+            outputs[path.with_name(path.name + suffix)] = compressed
+            outputs[hashed_path.with_name(hashed_path.name + suffix)] = compressed
+            encodings.append(encoding)
+
+    for target, content in outputs.items():
+        write_if_changed(target, content)
+    # Compressed siblings that were not rewritten would be served in place of the new content.
+    for suffix in _ENCODING_SUFFIXES.values():
+        for base in (path, hashed_path):
+            sibling = base.with_name(base.name + suffix)
+            if sibling not in outputs and sibling.exists():
+                LOGGER.debug("Removing outdated compressed copy %s", sibling)
+                sibling.unlink()
+    _prune_stale_versions(path, keep=hashed_path.name)
+
+    entry: Dict[str, Any] = {
+        "file": hashed_path.name,
+        "sha256": digest,
+        "fingerprint": fingerprint,
+        "version": version_of(fingerprint),
+        "bytes": len(data),
+        "encodings": encodings,
+    }
+    if previous and previous.get("deltas"):
+        entry["deltas"] = previous["deltas"]
+    artifacts[path.name] = entry
+    save_manifest(directory, manifest)
+    return PublishedArtifact(
+        path=path,
+        hashed_path=hashed_path,
+        sha256=digest,
+        version=version_of(fingerprint),
+        changed=True,
+        encodings=encodings,
+    )
+
+
+def load_previous_payload(path: Path) -> Dict[str, Any] | None:
+    """Return the JSON payload currently published at ``path``, if readable."""
+
+    if not path.exists():
+        return None
+    try:
+        with path.open("r", encoding="utf-8") as handle:
+            payload = json.load(handle)
+    except (OSError, ValueError) as exc:
+        LOGGER.warning("Could not read previous payload %s: %s", path, exc)
+        return None
+    return payload if isinstance(payload, dict) else None
+
+
+def publish_delta(
+    path: Path,
+    data: bytes,
+    from_version: str,
+    to_version: str,
+    keep: int = DELTA_HISTORY,
+    precompress: bool = True,
+) -> Path:
+    """Write a delta document for the artifact at ``path`` and extend its version chain.
+
+    The manifest entry of the artifact lists the most recent ``keep`` deltas
+    as ``from``/``to`` version pairs so clients holding an older copy can walk
+    the chain forward instead of downloading the full artifact.
+    """
+
+    path = Path(path)
+    directory = path.parent
+    delta_path = directory / f"{path.stem}.delta.{from_version}.{to_version}{path.suffix}"
+    write_if_changed(delta_path, data)
+    if precompress:
+        for encoding, compressed in _compressed_variants(data).items():
+            write_if_changed(delta_path.with_name(delta_path.name + _ENCODING_SUFFIXES[encoding]), compressed)
+
+    manifest = load_manifest(directory)
+    entry = manifest["artifacts"].setdefault(path.name, {})
+    deltas = [delta for delta in entry.get("deltas", []) if delta.get("from") != from_version]
+    deltas.append(
+        {"from": from_version, "to": to_version, "file": delta_path.name, "bytes": len(data)}
+    )
+    entry["deltas"] = deltas[-keep:]
+    save_manifest(directory, manifest)
+
+    retained = {delta["file"] for delta in entry["deltas"]}
+    pattern = re.compile(rf"^{re.escape(path.stem)}\.delta\.[0-9a-f]+\.[0-9a-f]+{re.escape(path.suffix)}")
+    for candidate in directory.iterdir():
+        match = pattern.match(candidate.name)
+        if match and match.group(0) not in retained:
+            LOGGER.debug("Removing expired delta %s", candidate)
+            candidate.unlink()
+    return delta_path
@@ -0,0 +1,146 @@
+"""Compact on-disk snapshots of matched, ranked news items.
+
+A snapshot lets several renderers share one collection run: ``collect_news``
+writes it once and ``run_agent.py``/``build_site.py`` can render from it
+without touching the network. The file starts with a short magic header and a
+format version, followed by zlib-compressed JSON in which each item is stored
+as a positional row.
+"""
+from __future__ import annotations
+
+import json
+import zlib
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Iterable, List, Sequence
+
+from .models import NewsItem
+from .sharding import ShardSpec
+
+MAGIC = b"CASNAP"
+FORMAT_VERSION = 1
+
+
+class SnapshotError(ValueError):
+    """Raised when a snapshot is unreadable, stale, or built from other configuration."""
+
+
+@dataclass(slots=True)
+class Snapshot:
+    """Items restored from a snapshot together with their provenance."""
+
+    created_at: datetime
+    config_hash: str
+    items: List[NewsItem]
+    shard: ShardSpec | None = None
+
+
+def _item_to_row(item: NewsItem) -> List[Any]:
+    return [
+        item.source,
+        item.title,
+        item.link,
+        item.published.isoformat() if item.published else None,
+        item.summary,
+        list(item.raw_categories),
+        list(item.vertical_matches),
+        list(item.compliance_matches),
+        item.keyword_hits,
+        item.relevance,
+    ]
+
+
+def _row_to_item(row: Sequence[Any]) -> NewsItem:
+    source, title, link, published, summary, categories, verticals, compliance, hits = row[:9]
+    return NewsItem(
+        source=source,
+        title=title,
+        link=link,
+        published=datetime.fromisoformat(published) if published else None,
+        summary=summary,
+        raw_categories=tuple(categories),
+        vertical_matches=list(verticals),
+        compliance_matches=list(compliance),
+        keyword_hits=hits,
+        # Rows written before batch scoring existed have no relevance column.
+        relevance=row[9] if len(row) > 9 else None,
+    )
+
+
+def write_snapshot(
+    path: Path,
+    items: Iterable[NewsItem],
+    config_hash: str,
+    created_at: datetime | None = None,
+    shard: ShardSpec | None = None,
+) -> Path:
+    """Serialize ``items`` to ``path`` and return the path written.
+
+    ``shard`` records which partition of the sources produced the items.
+    """
+
+    path = Path(path)
+    created_at = created_at or datetime.now(timezone.utc)
+    body = {
+        "created_at": created_at.isoformat(),
+        "config_hash": config_hash,
+        "shard": [shard.index, shard.count] if shard else None,
+        "items": [_item_to_row(item) for item in items],
+    }
+    encoded = json.dumps(body, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    staging = path.with_name(path.name + ".tmp")
+    staging.write_bytes(MAGIC + bytes([FORMAT_VERSION]) + zlib.compress(encoded, 6))
+    staging.replace(path)
+    return path
+
+
+def read_snapshot(path: Path) -> Snapshot:
+    """Load a snapshot without validating its age or configuration."""
+
+    path = Path(path)
+    if not path.exists():
+        raise FileNotFoundError(f"Snapshot file not found: {path}")
+    data = path.read_bytes()
+    header_length = len(MAGIC) + 1
+    if not data.startswith(MAGIC) or len(data) < header_length:
+        raise SnapshotError(f"{path} is not a compliance agent snapshot.")
+    version = data[len(MAGIC)]
+    if version != FORMAT_VERSION:
+        raise SnapshotError(f"{path} uses snapshot format {version}; expected {FORMAT_VERSION}.")
+    try:
+        body = json.loads(zlib.decompress(data[header_length:]))
+        shard = body.get("shard")
+        return Snapshot(
+            created_at=datetime.fromisoformat(body["created_at"]),
+            config_hash=body["config_hash"],
+            items=[_row_to_item(row) for row in body["items"]],
+            shard=ShardSpec(*shard) if shard else None,
+        )
+    except (zlib.error, ValueError, KeyError, TypeError) as exc:
+        raise SnapshotError(f"Snapshot {path} is corrupt: {exc}") from exc
+
+
+def load_snapshot(
+    path: Path,
+    config_hash: str | None = None,
+    max_age: timedelta | None = None,
+    now: datetime | None = None,
+) -> Snapshot:
+    """Load a snapshot and check it against the current configuration and ``max_age``."""
+
+    snapshot = read_snapshot(path)
+    if config_hash is not None and snapshot.config_hash != config_hash:
+        raise SnapshotError(
+            f"Snapshot {path} was built from a different configuration; collect again to refresh it."
+        )
+    if max_age is not None:
+        age = (now or datetime.now(timezone.utc)) - snapshot.created_at
+        if age > max_age:
+            minutes = int(age.total_seconds() // 60)
+            raise SnapshotError(
+                f"Snapshot {path} is {minutes} minutes old, older than the allowed "
+                f"{int(max_age.total_seconds() // 60)} minutes."
+            )
+    return snapshot